@@ -14,10 +14,14 @@ Docker Compose-based multi-platform build and push script with semantic versioni
 Now uses Docker Compose for all build operations instead of direct Docker commands.
 """
 
+import json
 import os
+import re
+import shutil
 import subprocess
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
 from pathlib import Path
 
 import click
@@ -26,8 +30,39 @@ import yaml
 from rich.console import Console
 from rich.table import Table
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 console = Console()
 
+# Git metadata needed by the builder; collected concurrently and cached
+GIT_METADATA_COMMANDS = {
+    "remote_url": ["git", "remote", "get-url", "origin"],
+    "user_name": ["git", "config", "user.name"],
+    "commit": ["git", "rev-parse", "--short", "HEAD"],
+    "branch": ["git", "branch", "--show-current"],
+    # Newest 50 version tags, sorted by git; enough to find the latest release
+    "version_tags": [
+        "git",
+        "for-each-ref",
+        "--sort=-v:refname",
+        "--format=%(refname:lstrip=2)",
+        "--count=50",
+        "refs/tags/v*",
+    ],
+}
+
+# v-prefixed semver tags: major, minor, patch, optional pre-release and build metadata
+VERSION_TAG_RE = re.compile(
+    r"^v(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)"
+    r"(?:-(?P<prerelease>[0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$"
+)
+
+# Characters not allowed in a Docker tag
+INVALID_TAG_CHARS = re.compile(r"[^a-z0-9_.-]+")
+
 
 class BuildError(Exception):
     """Custom exception for build errors"""
@@ -48,7 +83,10 @@ class DockerComposeBuilder:
         require_login: bool = True,
         compose_file: str = "docker-compose.build.yml",
         dev_mode: bool = False,
+        split_platforms: bool = True,
+        remote_arm64_endpoint: str | None = None,
     ):
+        self._git_metadata: dict[str, str | None] | None = None
         self.image_name = image_name or self._get_default_image_name()
         self.platforms = platforms
         self.dockerfile = dockerfile
@@ -59,9 +97,13 @@ class DockerComposeBuilder:
         self.require_login = require_login
         self.compose_file = compose_file
         self.dev_mode = dev_mode
+        self.split_platforms = split_platforms
+        self.remote_arm64_endpoint = remote_arm64_endpoint
         self.github_user = os.environ.get("GITHUB_USER") or self._get_git_user()
         self.github_token = os.environ.get("GITHUB_TOKEN")
         self.env_vars = {}
+        self._cached_run_env: dict | None = None
+        self.buildx_available = False
 
     def _get_default_image_name(self) -> str:
         """Get image name from git repository or current directory"""
@@ -73,29 +115,21 @@ class DockerComposeBuilder:
 
         try:
             # Get git remote URL
-            result = self._run_command(
-                ["git", "remote", "get-url", "origin"], check=False, verbose=False
-            )
-            if result.returncode == 0:
-                remote_url = result.stdout.strip()
-                # Parse GitHub URL
-                if "github.com" in remote_url:
-                    # Handle both HTTPS and SSH URLs
-                    if remote_url.startswith("https://"):
-                        parts = (
-                            remote_url.replace("https://github.com/", "")
-                            .replace(".git", "")
-                            .split("/")
-                        )
-                    elif remote_url.startswith("git@"):
-                        parts = (
-                            remote_url.replace("git@github.com:", "").replace(".git", "").split("/")
-                        )
-                    else:
-                        parts = []
-
-                    if len(parts) >= 2:
-                        return f"{parts[0]}/{parts[1]}"
+            remote_url = self._collect_git_metadata()["remote_url"]
+            # Parse GitHub URL
+            if remote_url is not None and "github.com" in remote_url:
+                # Handle both HTTPS and SSH URLs
+                if remote_url.startswith("https://"):
+                    parts = (
+                        remote_url.replace("https://github.com/", "").replace(".git", "").split("/")
+                    )
+                elif remote_url.startswith("git@"):
+                    parts = remote_url.replace("git@github.com:", "").replace(".git", "").split("/")
+                else:
+                    parts = []
+
+                if len(parts) >= 2:
+                    return f"{parts[0]}/{parts[1]}"
         except Exception:
             pass
 
@@ -105,23 +139,59 @@ class DockerComposeBuilder:
 
     def _get_git_user(self) -> str:
         """Get git username"""
-        try:
-            result = subprocess.run(
-                ["git", "config", "user.name"], capture_output=True, text=True, check=False
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
+        user_name = self._collect_git_metadata()["user_name"]
+        if user_name is not None:
+            return user_name
         return "GITHUB_USER_NOT_SET"
 
+    def _run_probes(
+        self, commands: dict[str, list[str]]
+    ) -> dict[str, subprocess.CompletedProcess | None]:
+        """Run independent probe commands concurrently.
+
+        The probes are dominated by process startup rather than CPU, so running
+        them in a thread pool makes the total wall time roughly that of the
+        slowest probe. A result is None when the command could not be executed.
+        """
+        results: dict[str, subprocess.CompletedProcess | None] = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(commands))) as executor:
+            futures = {
+                executor.submit(self._run_command, cmd, check=False, verbose=False): key
+                for key, cmd in commands.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except OSError:
+                    results[futures[future]] = None
+        return results
+
+    @staticmethod
+    def _probe_succeeded(result: subprocess.CompletedProcess | None) -> bool:
+        """Check whether a probe command ran and exited successfully"""
+        return result is not None and result.returncode == 0
+
+    def _collect_git_metadata(self) -> dict[str, str | None]:
+        """Collect git metadata once, running all git queries concurrently"""
+        if self._git_metadata is None:
+            results = self._run_probes(GIT_METADATA_COMMANDS)
+            self._git_metadata = {
+                key: result.stdout.strip() if self._probe_succeeded(result) else None
+                for key, result in results.items()
+            }
+        return self._git_metadata
+
     def _run_command(
-        self, cmd: list[str], check: bool = True, verbose: bool = True
+        self, cmd: list[str], check: bool = True, verbose: bool = True, stream: bool = False
     ) -> subprocess.CompletedProcess:
-        """Run a command and return the result"""
+        """Run a command and return the result
+
+        With ``stream=True`` the command writes straight to the terminal instead
+        of being captured, which suits long commands whose output isn't needed.
+        """
         if verbose:
             console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
-        return subprocess.run(cmd, capture_output=True, text=True, check=check)
+        return subprocess.run(cmd, capture_output=not stream, text=True, check=check)
 
     def _run_compose_command(
         self,
@@ -141,16 +211,55 @@ class DockerComposeBuilder:
         if verbose:
             console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
 
-        # Merge environment variables
-        run_env = os.environ.copy()
-        if env:
-            run_env.update(env)
-        run_env.update(self.env_vars)
+        return subprocess.run(
+            cmd, capture_output=capture_output, text=True, check=check, env=self._build_run_env(env)
+        )
+
+    def _run_bake_command(
+        self,
+        args: list[str],
+        check: bool = True,
+        verbose: bool = True,
+        capture_output: bool = True,
+        env: dict = None,
+    ) -> subprocess.CompletedProcess:
+        """Run a docker buildx bake command against the compose file"""
+        cmd = ["docker", "buildx", "bake"]
+        if self.compose_file:
+            cmd.extend(["-f", self.compose_file])
+        cmd.extend(args)
+
+        if verbose:
+            console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
 
         return subprocess.run(
-            cmd, capture_output=capture_output, text=True, check=check, env=run_env
+            cmd, capture_output=capture_output, text=True, check=check, env=self._build_run_env(env)
         )
 
+    def _build_run_env(self, env: dict = None) -> dict:
+        """Merge the process environment with the build environment variables
+
+        The merged environment is cached until prepare_build_env replaces
+        env_vars; explicit overrides in env take precedence over it. On POSIX
+        the environment is kept as bytes, so subprocess doesn't re-encode it on
+        every call.
+        """
+        if self._cached_run_env is None:
+            if os.supports_bytes_environ:
+                self._cached_run_env = {**os.environb, **self._encode_env(self.env_vars)}
+            else:
+                self._cached_run_env = {**os.environ, **self.env_vars}
+        if env:
+            return {**self._cached_run_env, **self._encode_env(env)}
+        return self._cached_run_env
+
+    @staticmethod
+    def _encode_env(env: dict) -> dict:
+        """Encode an environment mapping to bytes where the OS supports it"""
+        if not os.supports_bytes_environ:
+            return dict(env)
+        return {os.fsencode(key): os.fsencode(str(value)) for key, value in env.items()}
+
     def validate_requirements(self):
         """Validate all requirements are met"""
         console.print("[blue]Validating requirements...[/blue]")
@@ -160,19 +269,30 @@ class DockerComposeBuilder:
             ("docker", "Docker is required but not installed"),
             ("git", "Git is required but not installed"),
         ]:
-            if subprocess.run(["which", cmd], capture_output=True).returncode != 0:
+            if shutil.which(cmd) is None:
                 raise BuildError(msg)
 
-        # Check Docker Compose support
-        result = self._run_command(["docker", "compose", "version"], check=False, verbose=False)
-        if result.returncode != 0:
-            # Try docker-compose (hyphenated)
-            result = self._run_command(["docker-compose", "version"], check=False, verbose=False)
-            if result.returncode != 0:
-                raise BuildError(
-                    "Docker Compose is required but not installed.\n"
-                    "Please install Docker Desktop or Docker Compose plugin."
-                )
+        # Run the docker probes concurrently, then evaluate them in order
+        probes = self._run_probes(
+            {
+                "compose": ["docker", "compose", "version"],
+                "daemon": ["docker", "info"],
+                "buildx": ["docker", "buildx", "version"],
+            }
+        )
+
+        # Check Docker Compose support, falling back to docker-compose (hyphenated)
+        has_compose = self._probe_succeeded(probes["compose"]) or (
+            shutil.which("docker-compose") is not None
+            and self._probe_succeeded(
+                self._run_command(["docker-compose", "version"], check=False, verbose=False)
+            )
+        )
+        if not has_compose:
+            raise BuildError(
+                "Docker Compose is required but not installed.\n"
+                "Please install Docker Desktop or Docker Compose plugin."
+            )
 
         # Check compose file exists (create if it doesn't)
         if not Path(self.compose_file).exists():
@@ -184,13 +304,11 @@ class DockerComposeBuilder:
             raise BuildError(f"Dockerfile not found at {self.dockerfile}")
 
         # Check docker daemon is running
-        result = self._run_command(["docker", "info"], check=False, verbose=False)
-        if result.returncode != 0:
+        if not self._probe_succeeded(probes["daemon"]):
             raise BuildError("Docker daemon is not running")
 
         # Check buildx support
-        result = self._run_command(["docker", "buildx", "version"], check=False, verbose=False)
-        if result.returncode != 0:
+        if not self._probe_succeeded(probes["buildx"]):
             console.print(
                 "[yellow]![/yellow] Docker buildx support not available, "
                 "multi-platform builds may be limited"
@@ -223,12 +341,18 @@ class DockerComposeBuilder:
         }
 
         # Only add cache config if we're pushing (avoid cache push errors for local builds)
+        # Cache is read from the branch, then main, then the latest release, so a
+        # new branch reuses main's layers on its first build. The branch ref has no
+        # default: without one it would just repeat main's, and an empty ref only
+        # costs a failed (non-fatal) cache import
         if not self.skip_push and self.build_cache:
             build_config["cache_from"] = [
-                "type=registry,ref=${CACHE_FROM:-ghcr.io/bacalhau-project/sensor-log-generator:buildcache}"
+                "type=registry,ref=${CACHE_FROM_BRANCH:-}",
+                "type=registry,ref=${CACHE_FROM_MAIN:-ghcr.io/bacalhau-project/sensor-log-generator:buildcache-main}",
+                "type=registry,ref=${CACHE_FROM_LATEST:-ghcr.io/bacalhau-project/sensor-log-generator:buildcache-latest}",
             ]
             build_config["cache_to"] = [
-                "type=registry,ref=${CACHE_TO:-ghcr.io/bacalhau-project/sensor-log-generator:buildcache},mode=max"
+                "type=registry,ref=${CACHE_TO:-ghcr.io/bacalhau-project/sensor-log-generator:buildcache-main},mode=max"
             ]
 
         compose_content = {
@@ -241,7 +365,9 @@ class DockerComposeBuilder:
         }
 
         with open(self.compose_file, "w") as f:
-            yaml.dump(compose_content, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                compose_content, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+            )
 
         console.print(f"[green]✓[/green] Created {self.compose_file}")
 
@@ -284,7 +410,11 @@ class DockerComposeBuilder:
             console.print(
                 "[yellow]![/yellow] GITHUB_TOKEN not set, attempting to use existing Docker credentials"
             )
-            # Check if already logged in
+            if self._has_saved_registry_credentials():
+                console.print(f"[green]✓[/green] Found saved credentials for {self.registry}")
+                return
+
+            # No local credentials found, probe the registry
             result = subprocess.run(
                 ["docker", "pull", f"{self.registry}/hello-world"],
                 capture_output=True,
@@ -316,6 +446,38 @@ class DockerComposeBuilder:
 
         console.print("[green]✓[/green] Successfully logged in to Docker registry")
 
+    def _has_saved_registry_credentials(self) -> bool:
+        """Check the local Docker config for saved credentials for the registry
+
+        Avoids a network round-trip to the registry in the common case. Entries
+        backed by a credential helper are confirmed by asking the helper, which
+        is a local call.
+        """
+        config_dir = os.environ.get("DOCKER_CONFIG") or Path.home() / ".docker"
+        try:
+            config = json.loads((Path(config_dir) / "config.json").read_text())
+        except (OSError, ValueError):
+            return False
+
+        if config.get("auths", {}).get(self.registry, {}).get("auth"):
+            return True
+
+        helper = config.get("credHelpers", {}).get(self.registry) or config.get("credsStore")
+        if not helper:
+            return False
+
+        try:
+            result = subprocess.run(
+                [f"docker-credential-{helper}", "get"],
+                input=self.registry,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except OSError:
+            return False
+        return result.returncode == 0
+
     def setup_buildx_builder(self):
         """Setup buildx builder for multi-platform builds"""
         console.print("[blue]Setting up Docker Buildx for multi-platform builds...[/blue]")
@@ -327,6 +489,7 @@ class DockerComposeBuilder:
                 "[yellow]![/yellow] Docker Buildx not available, "
                 "using standard Docker Compose build"
             )
+            self.buildx_available = False
             return False
 
         # Check if builder exists
@@ -344,11 +507,16 @@ class DockerComposeBuilder:
             if "Status: running" in result.stdout:
                 console.print(f"[green]✓[/green] Using existing builder '{self.builder_name}'")
                 self._run_command(["docker", "buildx", "use", self.builder_name], verbose=False)
+                self._finish_builder_setup()
                 return True
             else:
-                console.print("[yellow]![/yellow] Removing non-functional builder")
+                # Keep the BuildKit state volume so the recreated builder
+                # (same name, same volume) still has its local layer cache
+                console.print("[yellow]![/yellow] Removing non-functional builder (keeping cache)")
                 self._run_command(
-                    ["docker", "buildx", "rm", self.builder_name], check=False, verbose=False
+                    ["docker", "buildx", "rm", "--keep-state", self.builder_name],
+                    check=False,
+                    verbose=False,
                 )
 
         # Create new builder
@@ -365,30 +533,106 @@ class DockerComposeBuilder:
                 "--bootstrap",
             ],
             verbose=False,
+            stream=True,  # Bootstrapping pulls the BuildKit image; show progress
         )
         self._run_command(["docker", "buildx", "use", self.builder_name], verbose=False)
         console.print("[green]✓[/green] Builder created and ready")
+        self._finish_builder_setup()
         return True
 
+    def _finish_builder_setup(self):
+        """Attach remote nodes and report how each target platform will be built"""
+        self.buildx_available = True
+        if self.remote_arm64_endpoint:
+            self._append_remote_arm64_node()
+        self._report_native_platforms()
+
+    def _append_remote_arm64_node(self):
+        """Append a remote arm64 node so the arm64 leg runs natively instead of under QEMU"""
+        node_name = f"{self.builder_name}-arm64"
+        result = self._run_command(
+            ["docker", "buildx", "inspect", self.builder_name], check=False, verbose=False
+        )
+        if node_name in result.stdout:
+            console.print(f"[green]✓[/green] Remote arm64 node '{node_name}' already attached")
+            return
+
+        result = self._run_command(
+            [
+                "docker",
+                "buildx",
+                "create",
+                "--append",
+                "--name",
+                self.builder_name,
+                "--node",
+                node_name,
+                "--platform",
+                "linux/arm64",
+                self.remote_arm64_endpoint,
+            ],
+            check=False,
+            verbose=False,
+        )
+        if result.returncode == 0:
+            console.print(
+                f"[green]✓[/green] Attached remote arm64 node at {self.remote_arm64_endpoint}"
+            )
+        else:
+            console.print(
+                f"[yellow]![/yellow] Could not attach remote arm64 node, "
+                f"falling back to emulation: {result.stderr.strip()}"
+            )
+
+    def _report_native_platforms(self):
+        """Log which target platforms have a native builder node"""
+        result = self._run_command(
+            ["docker", "buildx", "inspect", self.builder_name], check=False, verbose=False
+        )
+        if result.returncode != 0:
+            return
+
+        # buildx lists a node's native platform first on its "Platforms:" line
+        native_platforms = set()
+        for line in result.stdout.splitlines():
+            if line.strip().startswith("Platforms:"):
+                node_platforms = line.split(":", 1)[1].split(",")
+                if node_platforms and node_platforms[0].strip():
+                    native_platforms.add(node_platforms[0].strip().rstrip("*"))
+
+        for platform in self.platforms.split(","):
+            platform = platform.strip()
+            if platform in native_platforms:
+                console.print(f"[green]✓[/green] {platform}: native builder node")
+            else:
+                console.print(
+                    f"[yellow]![/yellow] {platform}: no native node, will be emulated with QEMU"
+                )
+
     def get_current_version(self) -> semver.Version | None:
         """Get the current version from git tags"""
         try:
-            result = self._run_command(["git", "tag", "--list", "v*"], check=False)
-            if result.returncode == 0 and result.stdout:
-                tags = result.stdout.strip().split("\n")
-                # Filter valid semver tags
-                versions = []
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag.startswith("v"):
-                        tag = tag[1:]
-                    try:
-                        versions.append(semver.Version.parse(tag))
-                    except Exception:
-                        continue
-
-                if versions:
-                    return max(versions)
+            version_tags = self._collect_git_metadata()["version_tags"]
+            if version_tags:
+                # Compare plain (major, minor, patch, is_release) tuples and only
+                # build a semver.Version for the winner. git's version sort puts
+                # pre-releases after their release, so don't trust its order alone.
+                candidates = (
+                    (
+                        (
+                            int(match["major"]),
+                            int(match["minor"]),
+                            int(match["patch"]),
+                            match["prerelease"] is None,
+                        ),
+                        tag,
+                    )
+                    for tag in version_tags.splitlines()
+                    if (match := VERSION_TAG_RE.match(tag.strip()))
+                )
+                best = max(candidates, key=lambda candidate: candidate[0], default=None)
+                if best is not None:
+                    return semver.Version.parse(best[1].strip()[1:])
         except Exception:
             pass
         return None
@@ -420,28 +664,22 @@ class DockerComposeBuilder:
 
     def get_git_info(self) -> tuple[str, str]:
         """Get git commit hash and branch"""
-        commit = "unknown"
-        branch = "unknown"
-
-        try:
-            result = self._run_command(
-                ["git", "rev-parse", "--short", "HEAD"], check=False, verbose=False
-            )
-            if result.returncode == 0:
-                commit = result.stdout.strip()
-
-            result = self._run_command(
-                ["git", "branch", "--show-current"], check=False, verbose=False
-            )
-            if result.returncode == 0:
-                branch = result.stdout.strip()
-        except Exception:
-            pass
+        metadata = self._collect_git_metadata()
+        commit = metadata["commit"] or "unknown"
+        branch = metadata["branch"] or "unknown"
 
         return commit, branch
 
-    def prepare_build_env(self, version: semver.Version, datetime_tag: str) -> list[str]:
-        """Prepare environment variables for the build"""
+    def prepare_build_env(
+        self, version: semver.Version, datetime_tag: str, now: datetime | None = None
+    ) -> list[str]:
+        """Prepare environment variables for the build
+
+        All timestamps are derived from the single ``now`` so BUILD_DATE and
+        the dev tag agree with each other and with ``datetime_tag``.
+        """
+        if now is None:
+            now = datetime.now(UTC)
         commit, branch = self.get_git_info()
         is_ci = os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS")
 
@@ -457,7 +695,7 @@ class DockerComposeBuilder:
         tags = []
         if self.dev_mode or not is_ci:
             # Development build
-            dev_timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+            dev_timestamp = now.strftime("%Y%m%d%H%M%S")
             tags = [
                 f"{base_image}:dev",
                 f"{base_image}:dev-{dev_timestamp}",
@@ -477,23 +715,41 @@ class DockerComposeBuilder:
         if commit != "unknown":
             tags.append(f"{base_image}:{commit}")
 
+        # Release builds write the shared latest cache, everything else its branch cache
+        branch_cache = f"{base_image}:buildcache-{self._cache_tag_slug(branch)}"
+        main_cache = f"{base_image}:buildcache-main"
+        if self.dev_mode or not is_ci:
+            cache_to = branch_cache
+        else:
+            cache_to = f"{base_image}:buildcache-latest"
+
         # Build environment variables
+        self._cached_run_env = None
         self.env_vars = {
             "IMAGE_TAG": tags[0],
             "PLATFORMS": self.platforms,
             "DOCKERFILE": self.dockerfile,
             "VERSION": version_str,
-            "BUILD_DATE": datetime.now().isoformat(),
+            "BUILD_DATE": now.isoformat(),
             "GIT_COMMIT": commit,
             "GIT_BRANCH": branch,
             "REGISTRY": self.registry,
             "IMAGE_NAME": self.image_name,
-            "CACHE_FROM": f"{base_image}:buildcache",
-            "CACHE_TO": f"{base_image}:buildcache",
+            # On main the branch cache is main's, so leave it out rather than read it twice
+            "CACHE_FROM_BRANCH": "" if branch_cache == main_cache else branch_cache,
+            "CACHE_FROM_MAIN": main_cache,
+            "CACHE_FROM_LATEST": f"{base_image}:buildcache-latest",
+            "CACHE_TO": cache_to,
         }
 
         return tags
 
+    @staticmethod
+    def _cache_tag_slug(branch: str) -> str:
+        """Convert a branch name into a valid Docker tag component"""
+        slug = INVALID_TAG_CHARS.sub("-", branch.lower()).strip("-.")
+        return slug[:100] or "unknown"
+
     def build_and_push_with_compose(
         self, version: semver.Version, datetime_tag: str, tags: list[str]
     ):
@@ -505,7 +761,123 @@ class DockerComposeBuilder:
 
         console.print("\n[yellow]Building images... (this may take a few minutes)[/yellow]")
 
-        # Build with compose
+        platform_list = [p.strip() for p in self.platforms.split(",") if p.strip()]
+        if (
+            self.buildx_available
+            and self.split_platforms
+            and not self.skip_push
+            and len(platform_list) > 1
+        ):
+            self._bake_platforms_in_parallel(tags, platform_list)
+        elif self.buildx_available:
+            self._bake_all_tags(tags)
+        else:
+            self._compose_build_and_alias(tags)
+
+        action = "built" if self.skip_push else "built and pushed"
+        console.print(f"\n[green]✓[/green] Successfully {action} all images")
+
+        return tags
+
+    def _bake_all_tags(self, tags: list[str]):
+        """Build every tag in a single buildx bake invocation"""
+        # The multi-platform build graph runs once; each tag is just another
+        # name for the resulting manifest.
+        bake_args = ["sensor-simulator"]
+        for tag in tags:
+            bake_args.extend(["--set", f"sensor-simulator.tags={tag}"])
+
+        if not self.skip_push:
+            bake_args.append("--push")
+
+        if not self.build_cache:
+            bake_args.append("--no-cache")
+
+        result = self._run_bake_command(
+            bake_args,
+            check=False,
+            capture_output=False,  # Show build output
+        )
+
+        if result.returncode != 0:
+            raise BuildError(f"Build failed for tags {', '.join(tags)}")
+
+        for tag in tags:
+            console.print(f"[green]✓[/green] Built {tag}")
+
+    def _bake_platforms_in_parallel(self, tags: list[str], platform_list: list[str]):
+        """Build each platform in its own bake invocation, then merge the manifests
+
+        On a single-arch host the emulated platform dominates a joint build.
+        Running one build per platform concurrently overlaps the native and
+        emulated legs; the per-platform images are then combined into one
+        multi-arch manifest under every tag. Requires pushing, since the
+        manifest is assembled in the registry.
+        """
+
+        def arch_suffix(platform: str) -> str:
+            return platform.split("/", 1)[-1].replace("/", "-")
+
+        arch_refs = {platform: f"{tags[0]}-{arch_suffix(platform)}" for platform in platform_list}
+
+        def bake_platform(platform: str) -> subprocess.CompletedProcess:
+            bake_args = [
+                "sensor-simulator",
+                "--set",
+                f"sensor-simulator.platform={platform}",
+                "--set",
+                f"sensor-simulator.tags={arch_refs[platform]}",
+                "--push",
+            ]
+            if self.build_cache:
+                # Each platform keeps its own cache so the builds don't overwrite each other
+                suffix = arch_suffix(platform)
+                for key in ("CACHE_FROM_BRANCH", "CACHE_FROM_MAIN", "CACHE_FROM_LATEST"):
+                    if not self.env_vars[key]:
+                        continue
+                    bake_args.extend(
+                        [
+                            "--set",
+                            f"sensor-simulator.cache-from=type=registry,ref={self.env_vars[key]}-{suffix}",
+                        ]
+                    )
+                bake_args.extend(
+                    [
+                        "--set",
+                        f"sensor-simulator.cache-to=type=registry,ref={self.env_vars['CACHE_TO']}-{suffix},mode=max",
+                    ]
+                )
+            else:
+                bake_args.append("--no-cache")
+
+            return self._run_bake_command(bake_args, check=False, capture_output=False)
+
+        with ThreadPoolExecutor(max_workers=len(platform_list)) as executor:
+            results = dict(
+                zip(platform_list, executor.map(bake_platform, platform_list), strict=True)
+            )
+
+        failed = [platform for platform, result in results.items() if result.returncode != 0]
+        if failed:
+            raise BuildError(f"Build failed for platforms {', '.join(failed)}")
+
+        for platform in platform_list:
+            console.print(f"[green]✓[/green] Built {arch_refs[platform]}")
+
+        # Assemble a multi-arch manifest for every tag in one registry-side call
+        cmd = ["docker", "buildx", "imagetools", "create"]
+        for tag in tags:
+            cmd.extend(["-t", tag])
+        cmd.extend(arch_refs.values())
+        result = self._run_command(cmd, check=False)
+        if result.returncode != 0:
+            raise BuildError(f"Failed to create multi-platform manifest: {result.stderr}")
+
+        for tag in tags:
+            console.print(f"[green]✓[/green] Created manifest {tag}")
+
+    def _compose_build_and_alias(self, tags: list[str]):
+        """Build the primary tag with Docker Compose and alias the rest (no buildx)"""
         build_args = ["build", "sensor-simulator"]
 
         # Add push flag if not skipping
@@ -516,25 +888,33 @@ class DockerComposeBuilder:
         if not self.build_cache:
             build_args.append("--no-cache")
 
-        # Build each tag separately (Docker Compose limitation)
-        for tag in tags:
-            self.env_vars["IMAGE_TAG"] = tag
-            result = self._run_compose_command(
-                build_args,
-                check=False,
-                capture_output=False,  # Show build output
-                env=self.env_vars,
-            )
+        # Build the primary tag once
+        primary_tag = tags[0]
+        result = self._run_compose_command(
+            build_args,
+            check=False,
+            capture_output=False,  # Show build output
+            env={"IMAGE_TAG": primary_tag},
+        )
 
-            if result.returncode != 0:
-                raise BuildError(f"Build failed for tag {tag}")
+        if result.returncode != 0:
+            raise BuildError(f"Build failed for tag {primary_tag}")
 
-            console.print(f"[green]✓[/green] Built {tag}")
+        console.print(f"[green]✓[/green] Built {primary_tag}")
 
-        action = "built" if self.skip_push else "built and pushed"
-        console.print(f"\n[green]✓[/green] Successfully {action} all images")
+        # The remaining tags are aliases of the same image, so tag (and push)
+        # them instead of rebuilding; pushing an alias only uploads a manifest
+        for tag in tags[1:]:
+            result = self._run_command(["docker", "tag", primary_tag, tag], check=False)
+            if result.returncode != 0:
+                raise BuildError(f"Failed to tag {tag}: {result.stderr}")
 
-        return tags
+            if not self.skip_push:
+                result = self._run_command(["docker", "push", tag], check=False)
+                if result.returncode != 0:
+                    raise BuildError(f"Failed to push {tag}: {result.stderr}")
+
+            console.print(f"[green]✓[/green] Tagged {tag}")
 
     def create_git_tag(self, version: semver.Version):
         """Create a git tag for the version"""
@@ -566,21 +946,26 @@ class DockerComposeBuilder:
         """Write tag information to files for reference"""
         console.print("[blue]Writing tag information to files...[/blue]")
 
-        Path(".latest-image-tag").write_text(f"{datetime_tag}\n")
-
         # Use the version string from env_vars which includes dev suffix if applicable
         version_str = self.env_vars.get("VERSION", str(version))
-        Path(".latest-semver").write_text(f"{version_str}\n")
 
+        files = {
+            ".latest-image-tag": f"{datetime_tag}\n",
+            ".latest-semver": f"{version_str}\n",
+            # Compose environment file
+            ".env.build": "".join(f"{key}={value}\n" for key, value in self.env_vars.items()),
+        }
         # Write first tag as the main registry image
         if tags:
-            Path(".latest-registry-image").write_text(f"{tags[0]}\n")
+            files[".latest-registry-image"] = f"{tags[0]}\n"
 
-        # Write compose environment file
-        env_content = []
-        for key, value in self.env_vars.items():
-            env_content.append(f"{key}={value}")
-        Path(".env.build").write_text("\n".join(env_content) + "\n")
+        # The files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            list(
+                executor.map(
+                    lambda item: Path(item[0]).write_bytes(item[1].encode()), files.items()
+                )
+            )
 
         console.print(f"  → .latest-image-tag: {datetime_tag}")
         console.print(f"  → .latest-semver: {version_str}")
@@ -674,6 +1059,17 @@ class DockerComposeBuilder:
 )
 @click.option("--no-cache", is_flag=True, envvar="NO_CACHE", help="Disable build cache")
 @click.option("--no-login", is_flag=True, envvar="NO_LOGIN", help="Skip Docker registry login")
+@click.option(
+    "--split-platforms/--no-split-platforms",
+    envvar="SPLIT_PLATFORMS",
+    default=True,
+    help="Build each platform in parallel and merge the manifests (push builds only)",
+)
+@click.option(
+    "--remote-arm64-endpoint",
+    envvar="BUILDX_ARM64_ENDPOINT",
+    help="Docker endpoint of a native arm64 host to append to the builder (avoids QEMU)",
+)
 @click.option(
     "--compose-file",
     envvar="COMPOSE_FILE",
@@ -691,6 +1087,8 @@ def main(
     skip_push: bool,
     no_cache: bool,
     no_login: bool,
+    split_platforms: bool,
+    remote_arm64_endpoint: str | None,
     compose_file: str,
 ):
     """
@@ -750,6 +1148,8 @@ def main(
         require_login=not no_login,
         compose_file=compose_file,
         dev_mode=dev_mode,
+        split_platforms=split_platforms,
+        remote_arm64_endpoint=remote_arm64_endpoint,
     )
 
     try:
@@ -786,11 +1186,12 @@ def main(
             else:
                 console.print(f"[blue]New version ({version_bump} bump): {version}[/blue]")
 
-        # Generate datetime tag
-        datetime_tag = datetime.now().strftime("%y%m%d%H%M")
+        # Capture one build timestamp and derive every time-based value from it
+        build_now = datetime.now(UTC)
+        datetime_tag = build_now.strftime("%y%m%d%H%M")
 
         # Prepare build environment
-        tags = builder.prepare_build_env(version, datetime_tag)
+        tags = builder.prepare_build_env(version, datetime_tag, now=build_now)
 
         # Build and push with Docker Compose
         tags = builder.build_and_push_with_compose(version, datetime_tag, tags)
@@ -44,6 +44,7 @@ class DatabaseConfig(BaseModel):
     """Database configuration settings."""
 
     path: str
+    bulk_mode: bool = False
     backup_enabled: bool
     backup_interval_seconds: int | float
     max_backup_size_mb: int | float
@@ -18,9 +18,15 @@ import sys
 import click
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
+from ruff_command import ruff_command
 
 console = Console()
 
+# Summary cells are parsed once here rather than re-parsing markup for every row
+PASSED_CELL = Text.from_markup("[green]✅ Passed[/green]")
+FAILED_CELL = Text.from_markup("[red]❌ Failed[/red]")
+
 
 def run_command(cmd: list[str], description: str) -> tuple[bool, str]:
     """Run a command and return success status and output."""
@@ -58,7 +64,15 @@ def run_command(cmd: list[str], description: str) -> tuple[bool, str]:
 @click.option("--fast", is_flag=True, help="Run only fast tests")
 @click.option("--fix", is_flag=True, help="Auto-fix linting issues")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
-def main(lint: bool, typecheck: bool, test: bool, fast: bool, fix: bool, verbose: bool):
+@click.option(
+    "--workers",
+    default="auto",
+    show_default=True,
+    help="pytest-xdist worker count for the full test run",
+)
+def main(
+    lint: bool, typecheck: bool, test: bool, fast: bool, fix: bool, verbose: bool, workers: str
+):
     """
     Run development checks before committing.
 
@@ -76,14 +90,15 @@ def main(lint: bool, typecheck: bool, test: bool, fast: bool, fix: bool, verbose
 
     # Ruff linting
     if lint:
-        cmd = ["uv", "run", "ruff", "check", "src/", "tests/", "main.py"]
+        ruff = ruff_command()
+        cmd = [*ruff, "check", "src/", "tests/", "main.py"]
         if fix:
             cmd.append("--fix")
         success, _ = run_command(cmd, "Ruff linting")
         results.append(("Linting", success))
 
         # Ruff formatting
-        cmd = ["uv", "run", "ruff", "format"]
+        cmd = [*ruff, "format"]
         if not fix:
             cmd.append("--check")
         cmd.extend(["src/", "tests/", "main.py"])
@@ -113,7 +128,8 @@ def main(lint: bool, typecheck: bool, test: bool, fast: bool, fix: bool, verbose
             ]
             test_desc = "Fast tests"
         else:
-            cmd = ["uv", "run", "pytest", "tests/", "-v"]
+            # loadfile keeps each file's tests (and their DB fixtures) on one worker
+            cmd = ["uv", "run", "pytest", "tests/", "-v", "-n", workers, "--dist=loadfile"]
             if verbose:
                 cmd.append("--tb=long")
             else:
@@ -132,9 +148,7 @@ def main(lint: bool, typecheck: bool, test: bool, fast: bool, fix: bool, verbose
 
     all_passed = True
     for check, passed in results:
-        status = "✅ Passed" if passed else "❌ Failed"
-        style = "green" if passed else "red"
-        table.add_row(check, f"[{style}]{status}[/{style}]")
+        table.add_row(check, PASSED_CELL if passed else FAILED_CELL)
         if not passed:
             all_passed = False
 
@@ -9,33 +9,38 @@ Clean up test databases from the data directory.
 Only sensor_data.db should exist in data/.
 """
 
+import os
+from contextlib import suppress
 from pathlib import Path
 
+DB_SUFFIXES = (".db", ".sqlite", ".lock")
+
 
 def clean_data_directory():
     """Remove all databases except sensor_data.db from data directory."""
-    data_dir = Path("data")
-    if not data_dir.exists():
-        print("No data directory found")
-        return
-
-    # Find all database files
-    db_files = list(data_dir.glob("*.db"))
-    db_files.extend(data_dir.glob("*.db-*"))
-    db_files.extend(data_dir.glob("*.sqlite"))
-    db_files.extend(data_dir.glob("*.lock"))
-
     removed_count = 0
     kept_files = []
 
-    for file in db_files:
-        # Keep only sensor_data.db and its associated files
-        if file.name.startswith("sensor_data.db"):
-            kept_files.append(file.name)
-        else:
-            print(f"Removing: {file}")
-            file.unlink()
-            removed_count += 1
+    # One directory pass, matching *.db, *.db-*, *.sqlite and *.lock by name
+    try:
+        with os.scandir("data") as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.endswith(DB_SUFFIXES) or ".db-" in name) or not entry.is_file():
+                    continue
+
+                # Keep only sensor_data.db and its associated files
+                if name.startswith("sensor_data.db"):
+                    kept_files.append(name)
+                else:
+                    print(f"Removing: {entry.path}")
+                    # WAL/SHM leftovers can vanish between listing and removal
+                    with suppress(FileNotFoundError):
+                        Path(entry.path).unlink()
+                        removed_count += 1
+    except FileNotFoundError:
+        print("No data directory found")
+        return
 
     print(f"\nCleaned up {removed_count} test database files")
     if kept_files:
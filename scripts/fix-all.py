@@ -12,23 +12,46 @@ Fix all linting and formatting issues automatically.
 This script aggressively fixes all auto-fixable issues.
 """
 
+import re
 import subprocess
+from collections import deque
 
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from ruff_command import ruff_command
 
 console = Console()
 
 
-def run_command(cmd: list, description: str, check: bool = False) -> bool:
-    """Run a command and return success status."""
+# Lines of the final ruff report kept for display and for the trailing summary
+REPORT_HEAD_LINES = 20
+REPORT_TAIL_LINES = 200
+
+FOUND_ERRORS_RE = re.compile(rb"Found (\d+) error")
+
+# Rule sets are merged into a single ruff invocation so the tree is parsed once
+BASIC_FIX_RULES = "I,F,E,W"
+AGGRESSIVE_FIX_RULES = "I,F,E,W,TRY,SIM,UP,C4"
+
+
+def run_command(cmd: list, description: str, check: bool = False, quiet: bool = False) -> bool:
+    """Run a command and return success status.
+
+    With ``quiet`` the command's output is discarded instead of captured,
+    for steps where only the exit status matters.
+    """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=check)
+        if quiet:
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=check
+            )
+        else:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=check)
         if result.returncode == 0:
             return True
         else:
-            if result.stderr and "error" in result.stderr.lower():
+            if not quiet and result.stderr and "error" in result.stderr.lower():
                 console.print(f"[yellow]⚠ {description}: Some issues remain[/yellow]")
             return False
     except Exception as e:
@@ -44,113 +67,44 @@ def main(aggressive: bool, test: bool):
     Automatically fix all linting and formatting issues.
 
     This will:
-    1. Format all Python files with Ruff
-    2. Fix all auto-fixable linting issues
-    3. Sort imports
-    4. Remove trailing whitespace
-    5. Optionally run tests to verify nothing broke
+    1. Sort imports and fix all auto-fixable linting issues in one ruff pass
+    2. Optionally remove commented-out code
+    3. Format all Python files with Ruff
+    4. Optionally run tests to verify nothing broke
     """
 
     console.print("\n[bold blue]🔧 Auto-fixing all issues...[/bold blue]\n")
+    ruff = ruff_command()
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        # Step 1: Format with Ruff
-        task = progress.add_task("[cyan]Formatting code with Ruff...", total=None)
-        run_command(["uv", "run", "ruff", "format", "src/", "tests/", "main.py"], "Ruff format")
-        progress.update(task, completed=True)
-
-        # Step 2: Fix imports
-        task = progress.add_task("[cyan]Fixing imports...", total=None)
-        run_command(
-            ["uv", "run", "ruff", "check", "--select", "I", "--fix", "src/", "tests/", "main.py"],
-            "Import sorting",
-        )
-        progress.update(task, completed=True)
-
-        # Step 3: Fix basic issues
-        task = progress.add_task("[cyan]Fixing basic linting issues...", total=None)
+        # Step 1: Fix imports, basic issues and (optionally) simplifications in one pass
+        task = progress.add_task("[cyan]Fixing linting issues...", total=None)
         run_command(
             [
-                "uv",
-                "run",
-                "ruff",
+                *ruff,
                 "check",
                 "--fix",
                 "--select",
-                "F,E,W",
+                AGGRESSIVE_FIX_RULES if aggressive else BASIC_FIX_RULES,
                 "src/",
                 "tests/",
                 "main.py",
             ],
-            "Basic fixes",
+            "Lint fixes",
+            quiet=True,
         )
         progress.update(task, completed=True)
 
         if aggressive:
-            # Step 4: Fix more issues (including removing commented code)
-            task = progress.add_task("[cyan]Applying aggressive fixes...", total=None)
-
-            # Fix redundant exception messages
-            run_command(
-                [
-                    "uv",
-                    "run",
-                    "ruff",
-                    "check",
-                    "--fix",
-                    "--select",
-                    "TRY",
-                    "src/",
-                    "tests/",
-                    "main.py",
-                ],
-                "Exception fixes",
-            )
-
-            # Fix simplifications
-            run_command(
-                [
-                    "uv",
-                    "run",
-                    "ruff",
-                    "check",
-                    "--fix",
-                    "--select",
-                    "SIM",
-                    "src/",
-                    "tests/",
-                    "main.py",
-                ],
-                "Simplifications",
-            )
-
-            # Fix comprehensions and modern syntax
+            # Step 2: Apply unsafe fixes for commented code removal
+            task = progress.add_task("[cyan]Removing commented code...", total=None)
             run_command(
                 [
-                    "uv",
-                    "run",
-                    "ruff",
-                    "check",
-                    "--fix",
-                    "--select",
-                    "UP,C4",
-                    "src/",
-                    "tests/",
-                    "main.py",
-                ],
-                "Modernization",
-            )
-
-            # Apply unsafe fixes for commented code removal
-            run_command(
-                [
-                    "uv",
-                    "run",
-                    "ruff",
+                    *ruff,
                     "check",
                     "--fix",
                     "--unsafe-fixes",
@@ -161,37 +115,38 @@ def main(aggressive: bool, test: bool):
                     "main.py",
                 ],
                 "Remove commented code",
+                quiet=True,
             )
-
             progress.update(task, completed=True)
 
-        # Step 5: Final format pass
-        task = progress.add_task("[cyan]Final formatting pass...", total=None)
-        run_command(["uv", "run", "ruff", "format", "src/", "tests/", "main.py"], "Final format")
+        # Step 3: Format last so it sees the output of every fix above
+        task = progress.add_task("[cyan]Formatting code with Ruff...", total=None)
+        run_command([*ruff, "format", "src/", "tests/", "main.py"], "Ruff format")
         progress.update(task, completed=True)
 
     # Show remaining issues
     console.print("\n[bold]📊 Checking remaining issues...[/bold]\n")
 
-    result = subprocess.run(
-        ["uv", "run", "ruff", "check", "src/", "tests/", "main.py"], capture_output=True, text=True
-    )
-
-    if result.returncode == 0:
+    # Stream the report, keeping only the first lines for display and the last
+    # lines for the "Found N errors" summary instead of buffering all of it
+    head: list[str] = []
+    tail: deque[bytes] = deque(maxlen=REPORT_TAIL_LINES)
+    with subprocess.Popen(
+        [*ruff, "check", "src/", "tests/", "main.py"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    ) as proc:
+        for line in proc.stdout:
+            if len(head) < REPORT_HEAD_LINES:
+                head.append(line.decode("utf-8", errors="replace").rstrip("\n"))
+            tail.append(line)
+
+    if proc.returncode == 0:
         console.print("[bold green]✨ All auto-fixable issues resolved![/bold green]")
     else:
         # Count remaining issues
-        lines = result.stdout.strip().split("\n")
-        error_count = 0
-        for line in lines:
-            if "Found" in line and "error" in line:
-                parts = line.split()
-                for i, part in enumerate(parts):
-                    if part == "Found":
-                        try:
-                            error_count = int(parts[i + 1])
-                        except (ValueError, IndexError):
-                            pass
+        match = FOUND_ERRORS_RE.search(b"".join(tail))
+        error_count = int(match.group(1)) if match else 0
 
         if error_count > 0:
             console.print(
@@ -200,7 +155,7 @@ def main(aggressive: bool, test: bool):
 
             # Show first few remaining issues
             shown = 0
-            for line in lines[:20]:
+            for line in head:
                 if line.strip() and not line.startswith("warning:"):
                     console.print(f"  {line}")
                     shown += 1
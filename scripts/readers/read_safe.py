@@ -8,79 +8,218 @@ import sqlite3
 import time
 from pathlib import Path
 
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
 
-def safe_read(db_path="data/sensor_data.db", query=None):
+SUMMARY_QUERY = """
+    SELECT
+        COUNT(*) as total_readings,
+        COUNT(DISTINCT sensor_id) as sensors,
+        MAX(timestamp) as latest,
+        SUM(anomaly_flag) as anomalies
+    FROM sensor_readings
+"""
+
+
+def _open_ro(db_path):
+    """
+    Open a read-only, query-only connection to the database.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        sqlite3.Connection
+    """
+    # Open in read-only mode with URI syntax
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro",
+        uri=True,
+        timeout=5.0,  # 5 second timeout
+        cached_statements=16,  # Repeated queries skip re-preparing
+    )
+
+    # Set to query-only for extra safety
+    conn.execute("PRAGMA query_only=1;")
+
+    # Serve reads from a memory map and a larger page cache instead of pread calls
+    conn.execute("PRAGMA mmap_size=268435456;")  # 256MB
+    conn.execute("PRAGMA cache_size=-65536;")  # 64MB
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    return conn
+
+
+def _describe_operational_error(e):
+    """Turn an OperationalError into a short status message."""
+    if "database is locked" in str(e):
+        return "Database busy (normal during writes)"
+    elif "file is not a database" in str(e):
+        return "Database updating (checkpoint in progress)"
+    else:
+        return f"Error: {e}"
+
+
+def safe_read_conn(conn, query, one=False, params=()):
+    """
+    Execute a query on an already open connection.
+
+    Args:
+        conn: Connection from _open_ro
+        query: SQL query to execute
+        one: Return only the first row instead of a list of rows
+        params: Parameters bound to the query placeholders
+
+    Returns:
+        Query result rows, or a single row if one is set
+        (sqlite3 errors propagate to the caller)
+    """
+    cursor = conn.execute(query, params)
+    return cursor.fetchone() if one else cursor.fetchall()
+
+
+def safe_read(db_path="data/sensor_data.db", query=None, one=False):
     """
     Safely read from the database using read-only mode.
 
     Args:
         db_path: Path to the database file
         query: SQL query to execute (default: count readings)
+        one: Return only the first row instead of a list of rows
 
     Returns:
         Query result or None if error
     """
-    if not Path(db_path).exists():
-        print(f"Database not found: {db_path}")
-        return None
-
     if query is None:
         query = "SELECT COUNT(*) as count FROM sensor_readings"
 
     try:
-        # Open in read-only mode with URI syntax
-        conn = sqlite3.connect(
-            f"file:{db_path}?mode=ro",
-            uri=True,
-            timeout=5.0,  # 5 second timeout
-        )
-
-        # Set to query-only for extra safety
-        conn.execute("PRAGMA query_only=1;")
+        conn = _open_ro(db_path)
 
         # Execute query
-        cursor = conn.cursor()
-        result = cursor.execute(query).fetchall()
+        result = safe_read_conn(conn, query, one=one)
 
         conn.close()
 
     except sqlite3.OperationalError as e:
-        if "database is locked" in str(e):
-            return "Database busy (normal during writes)"
-        elif "file is not a database" in str(e):
-            return "Database updating (checkpoint in progress)"
-        else:
-            return f"Error: {e}"
+        # A missing file surfaces here; no separate existence check needed
+        if "unable to open" in str(e):
+            print(f"Database not found: {db_path}")
+            return None
+        return _describe_operational_error(e)
     except Exception as e:
         return f"Unexpected error: {e}"
     else:
         return result
 
 
-def monitor_loop(interval=2):
-    """Monitor the database with safe reading."""
+def _open_write_watcher(db_path):
+    """
+    Watch the database directory so the monitor wakes when the writer flushes.
+
+    The directory is watched rather than the WAL file itself because SQLite
+    creates and removes the WAL as connections come and go.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        inotify_simple.INotify, or None when inotify is unavailable
+    """
+    if inotify_simple is None:
+        return None
+
+    watcher = inotify_simple.INotify()
+    flags = inotify_simple.flags.MODIFY | inotify_simple.flags.CREATE
+    try:
+        watcher.add_watch(str(Path(db_path).resolve().parent), flags)
+    except OSError:
+        watcher.close()
+        return None
+    return watcher
+
+
+def _wait_for_write(watcher, db_path, timeout):
+    """
+    Block until the database or its WAL is written, or timeout seconds pass.
+
+    The watched directory also holds the simulator's log and checkpoint files,
+    so events for any other file are ignored and waiting resumes.
+
+    Args:
+        watcher: inotify_simple.INotify from _open_write_watcher
+        db_path: Path to the database file
+        timeout: Maximum seconds to wait
+    """
+    db_name = Path(db_path).resolve().name
+    names = {db_name, f"{db_name}-wal"}
+    deadline = time.monotonic() + timeout
+    while (remaining := deadline - time.monotonic()) > 0:
+        events = watcher.read(timeout=remaining * 1000)
+        if any(event.name in names for event in events):
+            return
+
+
+def monitor_loop(interval=2, db_path="data/sensor_data.db"):
+    """Monitor the database with safe reading.
+
+    One read-only connection is reused across iterations and only reopened
+    after an OperationalError (e.g. while a checkpoint is in progress).
+    Readings are never deleted and ids only grow, so each tick counts just
+    the rows past the last id seen and adds them to a running total.
+    With inotify_simple installed, each tick waits for a write to land
+    (at most ``interval`` seconds) instead of sleeping the full interval.
+    """
     print("Monitoring database (Ctrl+C to stop)...")
     print("-" * 40)
 
     prev_count = 0
+    count = 0
+    last_rowid = 0
+    query = "SELECT COUNT(*), COALESCE(MAX(rowid), ?) FROM sensor_readings WHERE rowid > ?"
+    conn = None
+    watcher = _open_write_watcher(db_path)
 
-    while True:
-        result = safe_read()
-        timestamp = time.strftime("%H:%M:%S")
+    try:
+        while True:
+            try:
+                if conn is None:
+                    conn = _open_ro(db_path)
+                    # The file may have been recreated meanwhile, so recount from scratch
+                    count = last_rowid = 0
+                result = safe_read_conn(conn, query, one=True, params=(last_rowid, last_rowid))
+            except sqlite3.OperationalError as e:
+                result = _describe_operational_error(e)
+                if conn is not None:
+                    conn.close()
+                    conn = None
+            except Exception as e:
+                result = f"Unexpected error: {e}"
+            timestamp = time.strftime("%H:%M:%S")
 
-        if isinstance(result, list) and result:
-            count = result[0][0]
-            diff = count - prev_count if prev_count > 0 else 0
-            print(f"[{timestamp}] Readings: {count:,} (+{diff})")
-            prev_count = count
-        else:
-            print(f"[{timestamp}] {result}")
+            if isinstance(result, tuple):
+                new_rows, last_rowid = result
+                count += new_rows
+                diff = count - prev_count if prev_count > 0 else 0
+                print(f"[{timestamp}] Readings: {count:,} (+{diff})")
+                prev_count = count
+            else:
+                print(f"[{timestamp}] {result}")
 
-        try:
-            time.sleep(interval)
-        except KeyboardInterrupt:
-            print("\nStopped.")
-            break
+            try:
+                if watcher is None:
+                    time.sleep(interval)
+                else:
+                    _wait_for_write(watcher, db_path, interval)
+            except KeyboardInterrupt:
+                print("\nStopped.")
+                break
+    finally:
+        if conn is not None:
+            conn.close()
+        if watcher is not None:
+            watcher.close()
 
 
 def main():
@@ -97,35 +236,24 @@ def main():
     if args.monitor:
         monitor_loop(args.interval)
     else:
-        # Single query
-        query = (
-            args.query
-            or """
-            SELECT
-                COUNT(*) as total_readings,
-                COUNT(DISTINCT sensor_id) as sensors,
-                MAX(timestamp) as latest,
-                SUM(CASE WHEN anomaly_flag = 1 THEN 1 ELSE 0 END) as anomalies
-            FROM sensor_readings
-        """
-        )
-
-        result = safe_read(query=query)
-
-        if isinstance(result, list) and result:
-            if args.query:
-                # Custom query - just print results
+        if args.query:
+            # Custom query - just print results
+            result = safe_read(query=args.query)
+            if isinstance(result, list) and result:
                 for row in result:
                     print(row)
             else:
-                # Default summary query
-                row = result[0]
+                print(result)
+        else:
+            # Default summary query always yields exactly one row
+            row = safe_read(query=SUMMARY_QUERY, one=True)
+            if isinstance(row, tuple):
                 print(f"Total readings: {row[0]:,}")
                 print(f"Sensors: {row[1]}")
                 print(f"Latest: {row[2]}")
                 print(f"Anomalies: {row[3]}")
-        else:
-            print(result)
+            else:
+                print(row)
 
 
 if __name__ == "__main__":
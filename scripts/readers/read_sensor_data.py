@@ -6,10 +6,131 @@ This script shows various ways to safely read from the database while the sensor
 IMPORTANT: Always use read-only mode to prevent corruption!
 """
 
+import atexit
+import json
 import sqlite3
 import time
-from datetime import datetime, timedelta
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
+
+# JSON functions are built into SQLite from 3.38 on
+SQLITE_HAS_JSON = sqlite3.sqlite_version_info >= (3, 38, 0)
+
+# Query text is built once; the connection's statement cache reuses the prepared forms
+COUNT_QUERY = "SELECT COUNT(*) FROM sensor_readings"
+MAX_ROWID_QUERY = "SELECT max(id) FROM sensor_readings"
+# Changes whenever another connection commits, so idle polls can skip the real query
+DATA_VERSION_QUERY = "PRAGMA data_version"
+# The newest row's id doubles as the record count (ids are AUTOINCREMENT, never deleted)
+TICK_QUERY = """
+    SELECT id, sensor_id, temperature, anomaly_flag
+    FROM sensor_readings
+    ORDER BY id DESC
+    LIMIT 1
+"""
+LATEST_QUERY = """
+    SELECT
+        id,
+        timestamp,
+        sensor_id,
+        temperature,
+        humidity,
+        pressure,
+        voltage,
+        anomaly_flag,
+        anomaly_type
+    FROM sensor_readings
+    ORDER BY id DESC
+    LIMIT ?
+"""
+# Result keys for LATEST_QUERY, in column order
+LATEST_KEYS = (
+    "id",
+    "timestamp",
+    "sensor_id",
+    "temperature",
+    "humidity",
+    "pressure",
+    "voltage",
+    "anomaly",
+    "anomaly_type",
+)
+# JSON variants let SQLite build every row object in C, including the anomaly
+# boolean; the ordered subquery feeds json_group_array rows in order
+LATEST_JSON_QUERY = """
+    SELECT json_group_array(json_object(
+        'id', id,
+        'timestamp', timestamp,
+        'sensor_id', sensor_id,
+        'temperature', temperature,
+        'humidity', humidity,
+        'pressure', pressure,
+        'voltage', voltage,
+        'anomaly', CASE WHEN anomaly_flag != 0 THEN json('true') ELSE json('false') END,
+        'anomaly_type', anomaly_type
+    ))
+    FROM (SELECT * FROM sensor_readings ORDER BY id DESC LIMIT ?)
+"""
+# Bounds are computed by SQLite in UTC, formatted like the writer's ISO timestamps
+TIME_RANGE_QUERY = """
+    SELECT * FROM sensor_readings
+    WHERE timestamp >= strftime('%Y-%m-%dT%H:%M:%f', 'now', ?)
+        AND timestamp <= strftime('%Y-%m-%dT%H:%M:%f', 'now')
+    ORDER BY timestamp DESC
+"""
+ANOMALIES_QUERY = """
+    SELECT
+        id,
+        timestamp,
+        sensor_id,
+        temperature,
+        anomaly_type
+    FROM sensor_readings
+    WHERE anomaly_flag = 1
+    ORDER BY id DESC
+    LIMIT ?
+"""
+ANOMALIES_JSON_QUERY = """
+    SELECT json_group_array(json_object(
+        'id', id,
+        'timestamp', timestamp,
+        'sensor_id', sensor_id,
+        'temperature', temperature,
+        'anomaly_type', anomaly_type
+    ))
+    FROM (SELECT * FROM sensor_readings WHERE anomaly_flag = 1 ORDER BY id DESC LIMIT ?)
+"""
+STATISTICS_QUERY = """
+    SELECT
+        COUNT(*) as total_readings,
+        COUNT(DISTINCT sensor_id) as unique_sensors,
+        MIN(timestamp) as first_reading,
+        MAX(timestamp) as last_reading,
+        AVG(temperature) as avg_temperature,
+        MIN(temperature) as min_temperature,
+        MAX(temperature) as max_temperature,
+        AVG(humidity) as avg_humidity,
+        AVG(pressure) as avg_pressure,
+        SUM(anomaly_flag) as total_anomalies
+    FROM sensor_readings
+"""
+
+# Status line printed on each continuous monitoring tick
+STATUS_FORMAT = (
+    "[{time}] Records: {count:,} | Latest: {sensor_id} | "
+    "Temp: {temperature:.1f}°C | Anomaly: {anomaly}"
+)
+
+
+class MonitorTick(NamedTuple):
+    """Record count and newest reading, fetched together for one monitor update."""
+
+    count: int
+    sensor_id: str
+    temperature: float
+    anomaly: bool
 
 
 class SafeSensorReader:
@@ -21,6 +142,7 @@ class SafeSensorReader:
     def __init__(self, db_path: str = "data/sensor_data.db"):
         """Initialize the reader with database path."""
         self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
 
         # Check if database exists
         if not Path(db_path).exists():
@@ -30,132 +152,148 @@ class SafeSensorReader:
 
     def get_connection(self) -> sqlite3.Connection:
         """
-        Get a read-only connection to the database.
+        Get the shared read-only connection to the database.
+
+        The connection is opened on first use and reused by every query, so
+        polling loops don't pay for an open and schema load on each tick.
+        Under WAL each statement still sees the writer's latest commit.
 
         CRITICAL: This uses mode=ro to ensure read-only access!
         """
-        # ✅ CORRECT: Read-only connection
-        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        return conn
-
-    def get_record_count(self) -> int:
+        if self._conn is None:
+            # ✅ CORRECT: Read-only connection
+            # check_same_thread=False lets continuous_monitoring query from its worker thread
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                cached_statements=64,
+                check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row  # Enable column access by name
+            # Refuse writes, and serve reads from mmap and a larger page cache
+            conn.executescript(
+                """
+                PRAGMA query_only=1;
+                PRAGMA mmap_size=268435456;
+                PRAGMA cache_size=-65536;
+                PRAGMA temp_store=MEMORY;
+                """
+            )
+            self._conn = conn
+            atexit.register(self.close)
+        return self._conn
+
+    def close(self):
+        """Close the shared connection if it is open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            atexit.unregister(self.close)
+
+    def _conn_or_default(self, conn: sqlite3.Connection | None) -> sqlite3.Connection:
+        """Return the caller's connection, or the shared one when none is given."""
+        return conn if conn is not None else self.get_connection()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def get_record_count(self, conn: sqlite3.Connection | None = None) -> int:
         """Get total number of records in the database."""
-        conn = self.get_connection()
+        conn = self._conn_or_default(conn)
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM sensor_readings")
+        cursor.execute(COUNT_QUERY)
         count = cursor.fetchone()[0]
-        conn.close()
         return count
 
-    def get_latest_readings(self, limit: int = 10) -> list:
+    def _get_max_rowid(self, conn: sqlite3.Connection | None = None) -> int:
+        """
+        Get the highest reading id.
+
+        ids are AUTOINCREMENT and readings are only ever inserted, so growth in
+        max(id) equals growth in COUNT(*) but needs only one B-tree descent.
+        """
+        conn = self._conn_or_default(conn)
+        max_id = conn.execute(MAX_ROWID_QUERY).fetchone()[0]
+        return max_id or 0
+
+    def _data_version(self, conn: sqlite3.Connection | None = None) -> int:
+        """Get the connection's data version, which moves when other connections commit."""
+        conn = self._conn_or_default(conn)
+        return conn.execute(DATA_VERSION_QUERY).fetchone()[0]
+
+    def _tick(self, conn: sqlite3.Connection | None = None) -> MonitorTick | None:
+        """Fetch the count and newest reading in one query, or None if the table is empty."""
+        conn = self._conn_or_default(conn)
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        row = cursor.execute(TICK_QUERY).fetchone()
+        if row is None:
+            return None
+        count, sensor_id, temperature, anomaly_flag = row
+        return MonitorTick(count, sensor_id, temperature, bool(anomaly_flag))
+
+    def get_latest_readings(self, limit: int = 10, conn: sqlite3.Connection | None = None) -> list:
         """Get the most recent sensor readings."""
-        conn = self.get_connection()
+        conn = self._conn_or_default(conn)
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT
-                id,
-                timestamp,
-                sensor_id,
-                temperature,
-                humidity,
-                pressure,
-                voltage,
-                anomaly_flag,
-                anomaly_type
-            FROM sensor_readings
-            ORDER BY id DESC
-            LIMIT ?
-        """,
-            (limit,),
-        )
-
-        readings = []
-        for row in cursor.fetchall():
-            readings.append(
-                {
-                    "id": row["id"],
-                    "timestamp": row["timestamp"],
-                    "sensor_id": row["sensor_id"],
-                    "temperature": row["temperature"],
-                    "humidity": row["humidity"],
-                    "pressure": row["pressure"],
-                    "voltage": row["voltage"],
-                    "anomaly": bool(row["anomaly_flag"]),
-                    "anomaly_type": row["anomaly_type"],
-                }
-            )
-
-        conn.close()
+        # Plain tuples skip the per-field sqlite3.Row lookups
+        cursor.row_factory = None
+        if SQLITE_HAS_JSON:
+            cursor.execute(LATEST_JSON_QUERY, (limit,))
+            return json.loads(cursor.fetchone()[0])
+
+        cursor.execute(LATEST_QUERY, (limit,))
+        readings = [dict(zip(LATEST_KEYS, row, strict=True)) for row in cursor.fetchall()]
+        for reading in readings:
+            reading["anomaly"] = bool(reading["anomaly"])
         return readings
 
-    def get_readings_by_time_range(self, hours_ago: int = 1) -> list:
-        """Get readings from the last N hours."""
-        conn = self.get_connection()
+    def iter_readings_by_time_range(
+        self, hours_ago: int = 1, conn: sqlite3.Connection | None = None
+    ) -> Iterator[dict]:
+        """
+        Yield readings from the last N hours one at a time.
+
+        Rows are pulled from the cursor as they are consumed, so long ranges
+        never hold the whole result set in memory.
+        """
+        conn = self._conn_or_default(conn)
         cursor = conn.cursor()
+        cursor.execute(TIME_RANGE_QUERY, (f"-{hours_ago} hours",))
 
-        # Calculate time range
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=hours_ago)
-
-        cursor.execute(
-            """
-            SELECT * FROM sensor_readings
-            WHERE timestamp >= ? AND timestamp <= ?
-            ORDER BY timestamp DESC
-        """,
-            (start_time.isoformat(), end_time.isoformat()),
-        )
+        for row in cursor:
+            yield dict(row)
 
-        readings = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return readings
+    def get_readings_by_time_range(
+        self, hours_ago: int = 1, conn: sqlite3.Connection | None = None
+    ) -> list:
+        """Get readings from the last N hours."""
+        return list(self.iter_readings_by_time_range(hours_ago, conn))
 
-    def get_anomalies(self, limit: int = 20) -> list:
+    def get_anomalies(self, limit: int = 20, conn: sqlite3.Connection | None = None) -> list:
         """Get recent anomalies from the database."""
-        conn = self.get_connection()
+        conn = self._conn_or_default(conn)
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT
-                id,
-                timestamp,
-                sensor_id,
-                temperature,
-                anomaly_type
-            FROM sensor_readings
-            WHERE anomaly_flag = 1
-            ORDER BY id DESC
-            LIMIT ?
-        """,
-            (limit,),
-        )
+        if SQLITE_HAS_JSON:
+            cursor.execute(ANOMALIES_JSON_QUERY, (limit,))
+            return json.loads(cursor.fetchone()[0])
 
+        cursor.execute(ANOMALIES_QUERY, (limit,))
         anomalies = [dict(row) for row in cursor.fetchall()]
-        conn.close()
         return anomalies
 
-    def get_statistics(self) -> dict:
+    def get_statistics(self, conn: sqlite3.Connection | None = None) -> dict:
         """Get statistical summary of the sensor data."""
-        conn = self.get_connection()
+        conn = self._conn_or_default(conn)
         cursor = conn.cursor()
 
         # Overall stats
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total_readings,
-                COUNT(DISTINCT sensor_id) as unique_sensors,
-                MIN(timestamp) as first_reading,
-                MAX(timestamp) as last_reading,
-                AVG(temperature) as avg_temperature,
-                MIN(temperature) as min_temperature,
-                MAX(temperature) as max_temperature,
-                AVG(humidity) as avg_humidity,
-                AVG(pressure) as avg_pressure,
-                SUM(anomaly_flag) as total_anomalies
-            FROM sensor_readings
-        """)
+        cursor.execute(STATISTICS_QUERY)
 
         stats = dict(cursor.fetchone())
 
@@ -164,8 +302,6 @@ class SafeSensorReader:
             stats["anomaly_rate"] = stats["total_anomalies"] / stats["total_readings"]
         else:
             stats["anomaly_rate"] = 0
-
-        conn.close()
         return stats
 
     def monitor_growth(self, duration: int = 10):
@@ -176,11 +312,19 @@ class SafeSensorReader:
         print(f"\n📊 Monitoring database growth for {duration} seconds...")
 
         initial_count = self.get_record_count()
+        initial_max_id = self._get_max_rowid()
+        last_version = self._data_version()
         start_time = time.time()
 
         while time.time() - start_time < duration:
-            time.sleep(1)
-            current_count = self.get_record_count()
+            # Cheap version check; only re-read the table once a write has landed
+            time.sleep(0.1)
+            version = self._data_version()
+            if version == last_version:
+                continue
+            last_version = version
+
+            current_count = initial_count + self._get_max_rowid() - initial_max_id
             rate = (current_count - initial_count) / (time.time() - start_time)
             print(f"Records: {current_count:,} | Growth rate: {rate:.1f} records/sec", end="\r")
 
@@ -196,29 +340,45 @@ class SafeSensorReader:
         """
         Continuously monitor the database (Ctrl+C to stop).
         Useful for watching a running sensor simulator.
+
+        Queries run on a worker thread (sqlite3 releases the GIL while stepping),
+        so a slow query shows up as a busy line instead of stalling the display.
         """
         print(f"\n🔄 Continuous monitoring (interval: {interval}s, Ctrl+C to stop)")
         print("-" * 60)
 
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending: Future | None = None
         try:
             while True:
-                count = self.get_record_count()
-                latest = self.get_latest_readings(1)
-
-                if latest:
-                    reading = latest[0]
+                if pending is None:
+                    pending = executor.submit(self._tick)
+                try:
+                    tick = pending.result(timeout=interval)
+                except TimeoutError:
+                    print(f"[{time.strftime('%H:%M:%S')}] Waiting for database (query running)")
+                    continue
+                pending = None
+
+                if tick is not None:
                     print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] "
-                        f"Records: {count:,} | "
-                        f"Latest: {reading['sensor_id']} | "
-                        f"Temp: {reading['temperature']:.1f}°C | "
-                        f"Anomaly: {'Yes' if reading['anomaly'] else 'No'}"
+                        STATUS_FORMAT.format_map(
+                            {
+                                "time": time.strftime("%H:%M:%S"),
+                                "count": tick.count,
+                                "sensor_id": tick.sensor_id,
+                                "temperature": tick.temperature,
+                                "anomaly": "Yes" if tick.anomaly else "No",
+                            }
+                        )
                     )
 
                 time.sleep(interval)
 
         except KeyboardInterrupt:
             print("\n✋ Monitoring stopped")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
@@ -226,9 +386,13 @@ def main():
     print("🌡️ Sensor Database Reader - Safe Reading Examples")
     print("=" * 60)
 
-    # Create reader
-    reader = SafeSensorReader()
+    # Create reader; the shared connection is closed when the block exits
+    with SafeSensorReader() as reader:
+        _run_examples(reader)
+
 
+def _run_examples(reader: SafeSensorReader):
+    """Print the reading examples and offer the monitoring options."""
     # 1. Get basic count
     count = reader.get_record_count()
     print("\n📊 Database Statistics:")
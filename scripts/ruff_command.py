@@ -0,0 +1,24 @@
+"""Locate the project's pinned ruff for the development scripts."""
+
+import functools
+import os
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@functools.cache
+def ruff_command() -> list[str]:
+    """
+    Return the command prefix for running the project's ruff.
+
+    The project virtualenv's binary is used directly when it exists, which
+    skips `uv run` startup on every step. Otherwise `uv run ruff` resolves
+    the pinned dev dependency, the same ruff pre-commit runs. A ruff that
+    merely happens to be on PATH is never used, since its version may differ.
+    """
+    bin_dir = "Scripts" if os.name == "nt" else "bin"
+    ruff = PROJECT_ROOT / ".venv" / bin_dir / ("ruff.exe" if os.name == "nt" else "ruff")
+    if ruff.is_file():
+        return [str(ruff)]
+    return ["uv", "run", "ruff"]
@@ -14,6 +14,7 @@ Sets up pre-commit hooks and installs dependencies.
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 from rich.console import Console
@@ -22,12 +23,23 @@ from rich.panel import Panel
 console = Console()
 
 
-def run_command(cmd: list, description: str, check: bool = True) -> bool:
-    """Run a command and return success status."""
+def run_command(cmd: list, description: str, check: bool = True, quiet: bool = True) -> bool:
+    """
+    Run a command and return success status.
+
+    When quiet, stdout is discarded rather than buffered (hook installs can be
+    very chatty) and only stderr is kept for the failure message. Otherwise
+    the command's output streams straight to the terminal.
+    """
     console.print(f"[blue]→ {description}...[/blue]")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=check)
+        if quiet:
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=check
+            )
+        else:
+            result = subprocess.run(cmd, check=check)
         if result.returncode == 0:
             console.print(f"[green]  ✓ {description} complete[/green]")
             return True
@@ -84,9 +96,6 @@ def main(skip_hooks: bool, dev: bool):
         console.print("\n[bold]Step 2: Setting up pre-commit hooks[/bold]")
         console.print("[dim]This ensures code quality by running checks before each commit[/dim]")
 
-        # Install pre-commit
-        run_command(["uv", "pip", "install", "pre-commit"], "Installing pre-commit")
-
         # Check for existing hooks path that might conflict
         result = subprocess.run(
             ["git", "config", "--get", "core.hooksPath"],
@@ -103,26 +112,24 @@ def main(skip_hooks: bool, dev: bool):
                 check=False,
             )
 
-        # Install pre-commit hooks
-        success = run_command(["uv", "run", "pre-commit", "install"], "Installing pre-commit hooks")
-
-        if success:
-            run_command(
-                ["uv", "run", "pre-commit", "install", "--hook-type", "pre-push"],
-                "Installing pre-push hooks",
-            )
-
-        # Install hook environments
-        console.print("[blue]→ Setting up hook environments (this may take a minute)...[/blue]")
-        result = subprocess.run(
-            ["uv", "run", "pre-commit", "install-hooks"],
-            capture_output=True,
-            text=True,
+        # Install both hook types and their environments with one uvx invocation,
+        # which runs pre-commit without adding it to the project environment
+        console.print("[dim]  Setting up hook environments may take a minute[/dim]")
+        success = run_command(
+            [
+                "uvx",
+                "pre-commit",
+                "install",
+                "--install-hooks",
+                "--hook-type",
+                "pre-commit",
+                "--hook-type",
+                "pre-push",
+            ],
+            "Installing pre-commit and pre-push hooks",
             check=False,
         )
-        if result.returncode == 0:
-            console.print("[green]  ✓ Hook environments ready[/green]")
-        else:
+        if not success:
             console.print("[yellow]  ⚠ Some hooks may need to be installed on first run[/yellow]")
 
     console.print("\n[bold]Step 3: Verifying setup[/bold]")
@@ -135,10 +142,16 @@ def main(skip_hooks: bool, dev: bool):
         (["uv", "run", "pytest", "--version"], "Pytest"),
     ]
 
+    # Each check is a separate `uv run` cold start, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [
+            executor.submit(subprocess.run, cmd, capture_output=True, check=False)
+            for cmd, _ in checks
+        ]
+
     all_good = True
-    for cmd, name in checks:
-        result = subprocess.run(cmd, capture_output=True, check=False)
-        if result.returncode == 0:
+    for (_, name), future in zip(checks, futures, strict=True):
+        if future.result().returncode == 0:
             console.print(f"[green]  ✓ {name} is working[/green]")
         else:
             console.print(f"[red]  ✗ {name} is not working[/red]")
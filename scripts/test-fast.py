@@ -13,7 +13,10 @@ Run tests efficiently with different speed profiles.
 
 import subprocess
 import sys
+import tempfile
 import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
 
 import click
 from rich.console import Console
@@ -22,20 +25,47 @@ from rich.table import Table
 console = Console()
 
 
+def _junit_summary(junit_path: Path) -> str:
+    """Build a pytest-style summary line from a JUnit XML report."""
+    # Subtests repeat their parent's testcase entry; count each test once, by its worst outcome
+    severity = {"passed": 0, "skipped": 1, "failed": 2, "errors": 3}
+    outcomes: dict[tuple[str | None, str | None], str] = {}
+    for case in ET.parse(junit_path).iter("testcase"):
+        outcome = "passed"
+        for tag, label in (("error", "errors"), ("failure", "failed"), ("skipped", "skipped")):
+            if case.find(tag) is not None:
+                outcome = label
+                break
+        key = (case.get("classname"), case.get("name"))
+        if severity[outcome] >= severity[outcomes.get(key, "passed")]:
+            outcomes[key] = outcome
+
+    if not outcomes:
+        return "No tests run"
+
+    # Same ordering as pytest's own summary line
+    counts = dict.fromkeys(("failed", "passed", "skipped", "errors"), 0)
+    for outcome in outcomes.values():
+        counts[outcome] += 1
+    return ", ".join(f"{count} {label}" for label, count in counts.items() if count)
+
+
 def run_tests(cmd: list, description: str) -> tuple[bool, float, str]:
-    """Run tests and return (success, duration, summary)."""
+    """
+    Run tests and return (success, duration, summary).
+
+    pytest output streams straight to the terminal; the summary is read from
+    a JUnit XML report instead of buffering and scanning the whole output.
+    """
     start = time.time()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        duration = time.time() - start
-
-        # Parse output for summary
-        summary = "No tests run"
-        for line in result.stdout.split("\n"):
-            if "passed" in line or "failed" in line:
-                summary = line.strip()
-                break
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            junit_path = Path(tmp_dir) / "results.xml"
+            result = subprocess.run([*cmd, f"--junitxml={junit_path}"], check=False)
+            duration = time.time() - start
+
+            summary = _junit_summary(junit_path) if junit_path.exists() else "No tests run"
 
         return result.returncode == 0, duration, summary
     except Exception as e:
@@ -72,17 +102,27 @@ def main(level: str, parallel: bool, verbose: bool, coverage: bool, failed_first
 
     # Configure based on level
     if level == "critical":
-        # Only run most critical tests
+        # Only run most critical tests, skipping plugins and config a smoke check doesn't need
         cmd.extend(
             [
                 "tests/test_config.py",
                 "tests/test_enums.py",
-                "tests/test_database.py::TestDatabaseConnectionManager",
+                "tests/test_database.py::TestSensorDatabase",
                 "-q",
                 "--tb=no",
                 "--disable-warnings",
+                "--no-header",
+                "-o",
+                "addopts=",
+                "-p",
+                "no:randomly",
+                "-p",
+                "no:cov",
             ]
         )
+        # --failed-first needs the cache plugin
+        if not failed_first:
+            cmd.extend(["-p", "no:cacheprovider"])
         expected_time = "~5 seconds"
 
     elif level == "fast":
@@ -125,7 +165,8 @@ def main(level: str, parallel: bool, verbose: bool, coverage: bool, failed_first
         cmd.append("--quiet")
 
     if coverage and level != "critical":
-        cmd.extend(["--cov=src", "--cov-report=term-missing:skip-covered"])
+        # Failed runs skip the report; branch coverage is off in pyproject.toml
+        cmd.extend(["--cov=src", "--cov-report=term-missing:skip-covered", "--no-cov-on-fail"])
 
     if failed_first:
         cmd.append("--failed-first")
@@ -1,92 +1,161 @@
 #!/usr/bin/env python3
 """Fix test issues in the codebase."""
 
+import json
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
+_PATH_METHOD_RE = re.compile(r"Path\.(exists|stat|unlink)\(([^)]+)\)")
+_PATH_METHOD_CALLS = ("Path.exists(", "Path.stat(", "Path.unlink(")
+_PATH_REPLACE_CALL = "Path.replace("
+# store_reading parameters that insert_reading doesn't accept
+_UNSUPPORTED_PARAMS_RE = re.compile(r"timestamp=|humidity=|pressure=|original_timezone=")
+# Per-fix record of files already verified clean, keyed on "size:mtime_ns"
+_CACHE_FILE = Path(".fix_tests_cache.json")
 
-def fix_path_exists_calls():
-    """Fix Path.exists() calls to Path().exists()."""
-    test_files = list(Path("tests").glob("*.py"))
 
-    for file_path in test_files:
-        content = file_path.read_text()
-        original_content = content
+def _load_cache() -> dict[str, dict[str, str]]:
+    """Load the clean-file cache, starting empty if it is missing or unreadable."""
+    try:
+        return json.loads(_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict[str, dict[str, str]]) -> None:
+    """Persist the clean-file cache for the next run."""
+    _CACHE_FILE.write_text(json.dumps(cache, indent=2, sort_keys=True))
+
+
+def _stat_key(st: os.stat_result) -> str:
+    """Key a file version on size and mtime so edits invalidate the cache."""
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _iter_py_files(dirname: str) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield (path, stat) for each Python file in a directory."""
+    with os.scandir(dirname) as entries:
+        for entry in entries:
+            if entry.name.endswith(".py") and entry.is_file():
+                yield entry.path, entry.stat()
+
+
+def _read_text(path: str, size: int) -> str:
+    """Read a whole file in a single unbuffered read."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size).decode("utf-8")
+    finally:
+        os.close(fd)
 
-        # Fix Path.exists(path) -> Path(path).exists()
-        content = re.sub(r"Path\.exists\(([^)]+)\)", r"Path(\1).exists()", content)
 
-        # Fix Path.stat(path) -> Path(path).stat()
-        content = re.sub(r"Path\.stat\(([^)]+)\)", r"Path(\1).stat()", content)
+def _write_text(path: str | Path, content: str) -> None:
+    """Write a whole file from pre-encoded bytes, bypassing buffered text I/O."""
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than asked for large files
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
 
-        # Fix Path.unlink(path) -> Path(path).unlink()
-        content = re.sub(r"Path\.unlink\(([^)]+)\)", r"Path(\1).unlink()", content)
+
+def fix_path_exists_calls(cache: dict[str, dict[str, str]] | None = None):
+    """Fix Path.exists() calls to Path().exists()."""
+    clean = {} if cache is None else cache.setdefault("fix_path_exists_calls", {})
+    for file_path, st in _iter_py_files("tests"):
+        key = _stat_key(st)
+        if clean.get(file_path) == key:
+            continue
+        content = _read_text(file_path, st.st_size)
+        original_content = content
+
+        # Cheap substring checks gate the regex; most files need no fixes
+        if any(call in content for call in _PATH_METHOD_CALLS):
+            # Fix Path.exists/stat/unlink(path) -> Path(path).exists/stat/unlink()
+            # in a single pass
+            content = _PATH_METHOD_RE.sub(r"Path(\2).\1()", content)
 
         if content != original_content:
-            file_path.write_text(content)
+            _write_text(file_path, content)
             print(f"Fixed Path issues in {file_path}")
+        else:
+            clean[file_path] = key
 
 
-def fix_store_reading_calls():
+def fix_store_reading_calls(cache: dict[str, dict[str, str]] | None = None):
     """Fix store_reading calls that use keyword arguments."""
+    clean = {} if cache is None else cache.setdefault("fix_store_reading_calls", {})
     file_path = Path("tests/test_database_read_operations.py")
-    content = file_path.read_text()
+    st = file_path.stat()
+    key = _stat_key(st)
+    if clean.get(str(file_path)) == key:
+        return
+    content = _read_text(str(file_path), st.st_size)
+    original_content = content
 
     # For test_get_readings_by_time_range and similar tests
     # These need custom handling since they use timestamps
-    lines = content.split("\n")
-    new_lines = []
-    in_store_reading = False
-    store_reading_indent = 0
-
-    for i, line in enumerate(lines):
-        if "self.db.store_reading(" in line or "db.store_reading(" in line:
-            # Replace store_reading with insert_reading for tests
-            new_line = line.replace("store_reading(", "insert_reading(")
-            new_lines.append(new_line)
-            in_store_reading = True
-            store_reading_indent = len(line) - len(line.lstrip())
-        elif in_store_reading:
-            # Check if we're still in the function call
-            if line.strip().startswith(")") or (
-                line.strip() and len(line) - len(line.lstrip()) <= store_reading_indent
-            ):
-                in_store_reading = False
-            # Remove parameters that insert_reading doesn't accept
-            elif any(
-                param in line
-                for param in ["timestamp=", "humidity=", "pressure=", "original_timezone="]
-            ):
-                continue  # Skip these lines
-            new_lines.append(line)
-        else:
-            new_lines.append(line)
-
-    content = "\n".join(new_lines)
-    file_path.write_text(content)
-    print(f"Fixed store_reading calls in {file_path}")
-
-
-def fix_path_replace_calls():
+    def rewritten_lines():
+        in_store_reading = False
+        store_reading_indent = 0
+
+        for line in content.splitlines(keepends=True):
+            if "self.db.store_reading(" in line or "db.store_reading(" in line:
+                # Replace store_reading with insert_reading for tests
+                yield line.replace("store_reading(", "insert_reading(")
+                in_store_reading = True
+                store_reading_indent = len(line) - len(line.lstrip())
+            elif in_store_reading:
+                # Check if we're still in the function call
+                if line.strip().startswith(")") or (
+                    line.strip() and len(line) - len(line.lstrip()) <= store_reading_indent
+                ):
+                    in_store_reading = False
+                # Remove parameters that insert_reading doesn't accept
+                elif _UNSUPPORTED_PARAMS_RE.search(line):
+                    continue  # Skip these lines
+                yield line
+            else:
+                yield line
+
+    content = "".join(rewritten_lines())
+    if content != original_content:
+        _write_text(file_path, content)
+        print(f"Fixed store_reading calls in {file_path}")
+    else:
+        clean[str(file_path)] = key
+
+
+def fix_path_replace_calls(cache: dict[str, dict[str, str]] | None = None):
     """Fix Path.replace() calls."""
-    test_files = list(Path("tests").glob("*.py"))
-
-    for file_path in test_files:
-        content = file_path.read_text()
+    clean = {} if cache is None else cache.setdefault("fix_path_replace_calls", {})
+    for file_path, st in _iter_py_files("tests"):
+        key = _stat_key(st)
+        if clean.get(file_path) == key:
+            continue
+        content = _read_text(file_path, st.st_size)
         original_content = content
 
         # Path.replace() with 3 args doesn't exist, it's str.replace()
         # Find these and fix them
-        if "Path.replace(" in content:
-            content = content.replace("Path.replace(", "str.replace(")
+        if _PATH_REPLACE_CALL not in content:
+            clean[file_path] = key
+            continue
+        content = content.replace(_PATH_REPLACE_CALL, "str.replace(")
 
         if content != original_content:
-            file_path.write_text(content)
+            _write_text(file_path, content)
             print(f"Fixed Path.replace in {file_path}")
 
 
 if __name__ == "__main__":
-    fix_path_exists_calls()
-    fix_store_reading_calls()
-    fix_path_replace_calls()
+    cache = _load_cache()
+    fix_path_exists_calls(cache)
+    fix_store_reading_calls(cache)
+    fix_path_replace_calls(cache)
+    _save_cache(cache)
     print("Test fixes complete!")
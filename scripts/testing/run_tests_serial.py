@@ -1,38 +1,71 @@
 #!/usr/bin/env python3
-"""Run pytest tests serially to avoid timeout issues."""
+"""Run pytest tests with per-file isolation to avoid timeout issues."""
 
 import subprocess
 import sys
+import tempfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 
-def run_tests_serially():
-    """Run each test file individually."""
-    test_dir = Path("tests")
-    test_files = sorted(test_dir.glob("test_*.py"))
+def _file_results(junit_path: Path) -> dict[str, bool]:
+    """Map each test file name to whether all of its tests passed."""
+    results: dict[str, bool] = {}
+    for case in ET.parse(junit_path).iter("testcase"):
+        # classname is "tests.test_module" or "tests.test_module.TestClass";
+        # a collection error has an empty classname and the module as its name
+        module = (case.get("classname") or case.get("name", "")).split(".")
+        file_name = f"{module[1] if len(module) > 1 else module[0]}.py"
+        failed = case.find("failure") is not None or case.find("error") is not None
+        results[file_name] = results.get(file_name, True) and not failed
+    return results
 
-    failed_tests = []
-    passed_count = 0
-    failed_count = 0
 
-    for test_file in test_files:
-        print(f"\n{'=' * 60}")
-        print(f"Running: {test_file}")
-        print("=" * 60)
+def run_tests_serially():
+    """
+    Run all test files in one pytest session.
+
+    pytest-xdist's loadfile mode keeps each file on a single worker, so files
+    stay isolated from each other without paying interpreter and plugin
+    startup once per file.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        junit_path = Path(tmp_dir) / "results.xml"
 
         result = subprocess.run(
-            ["uv", "run", "pytest", str(test_file), "-v", "--tb=short", "--timeout=10"],
+            [
+                "uv",
+                "run",
+                "pytest",
+                "tests/",
+                "-n",
+                "auto",
+                "--dist=loadfile",
+                # A file that fails to import must not stop the other files
+                "--continue-on-collection-errors",
+                "-v",
+                "--tb=short",
+                "--timeout=10",
+                f"--junitxml={junit_path}",
+            ],
             capture_output=False,
             text=True,
         )
 
-        if result.returncode == 0:
+        file_results = _file_results(junit_path) if junit_path.exists() else {}
+
+    failed_tests = []
+    passed_count = 0
+    failed_count = 0
+
+    for file_name, passed in sorted(file_results.items()):
+        if passed:
             passed_count += 1
-            print(f"✓ {test_file.name} PASSED")
+            print(f"✓ {file_name} PASSED")
         else:
             failed_count += 1
-            failed_tests.append(test_file.name)
-            print(f"✗ {test_file.name} FAILED")
+            failed_tests.append(file_name)
+            print(f"✗ {file_name} FAILED")
 
     print(f"\n{'=' * 60}")
     print("SUMMARY")
@@ -46,7 +79,7 @@ def run_tests_serially():
             print(f"  - {test}")
         return 1
 
-    return 0
+    return result.returncode
 
 
 if __name__ == "__main__":
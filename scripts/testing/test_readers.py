@@ -12,10 +12,17 @@ Test concurrent readers against an existing sensor database.
 This script only reads from the database - it doesn't start the sensor simulator.
 """
 
-import datetime
+import contextlib
+import logging
+import logging.handlers
 import multiprocessing
+import multiprocessing.connection
+import os
+import queue
 import signal
 import sqlite3
+import sys
+import threading
 import time
 from pathlib import Path
 
@@ -24,148 +31,356 @@ from rich.console import Console
 from rich.live import Live
 from rich.table import Table
 
+try:
+    import apsw
+except ImportError:
+    apsw = None
+
 console = Console()
 
+# Errors a reader may get from either backend
+DB_ERRORS = (sqlite3.Error,) if apsw is None else (sqlite3.Error, apsw.Error)
+
+# Readers never write, so lock that in and give each connection a large page
+# cache and memory map; journal_mode is left to the writer
+READER_PRAGMAS = """
+    PRAGMA query_only=1;
+    PRAGMA cache_size=-64000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Module-level SQL so every iteration passes the identical string and hits the
+# connection's prepared-statement cache instead of being recompiled. COUNT(*)
+# walks the whole table, so it only runs once per connection as a baseline,
+# fetched together with the id it was taken at in a single statement
+BASELINE_QUERY = "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM sensor_readings"
+MAX_ID_QUERY = "SELECT COALESCE(MAX(id), 0) FROM sensor_readings"
+LATEST_QUERY = """
+    SELECT id, timestamp, sensor_id, temperature, humidity
+    FROM sensor_readings
+    ORDER BY id DESC
+    LIMIT 1
+"""
+
+# Slots of each reader's row in the shared stats array. Readers overwrite
+# their own row in place and the monitor reads it on refresh, so periodic
+# progress never gets pickled; only errors and the final report use the pipe.
+# latest_id is -1 until a row has been seen.
+READS, ERRORS, COUNT, LATEST_ID, NEW_RECORDS, UPDATED_MS = range(6)
+STAT_SLOTS = 6
+
+# Readers report SQLite errors by primary result code and the monitor turns
+# the code into a label, so nothing string-matches error messages per error.
+# Codes without a label (e.g. SQLITE_ERROR for a missing table) also carry
+# their message.
+ERROR_LABELS = {
+    sqlite3.SQLITE_BUSY: "Database locked",
+    sqlite3.SQLITE_LOCKED: "Database locked",
+    sqlite3.SQLITE_CORRUPT: "DATABASE CORRUPTED - disk image malformed",
+    sqlite3.SQLITE_NOTADB: "DATABASE CORRUPTED - invalid file",
+}
+
+# Debug log records buffered per reader before readers start dropping them,
+# a few seconds' worth at the fastest read interval
+DEBUG_QUEUE_PER_READER = 64
+
+
+def open_reader_connection(
+    db_path: str,
+    immutable: bool = False,
+    check_same_thread: bool = True,
+    backend: str = "sqlite3",
+):
+    """
+    Open a tuned read-only connection to the sensor database.
+
+    Args:
+        db_path: Path to the SQLite database
+        immutable: Open the database as immutable, skipping all locking
+        check_same_thread: Pass False to share the connection between threads
+        backend: "sqlite3" for the standard library module, or "apsw"
+
+    Returns:
+        sqlite3.Connection or apsw.Connection; both provide the cursor(),
+        execute() and fetchall() calls the readers use
+    """
+    # immutable=1 skips file locks and the -shm mapping entirely, but SQLite
+    # then ignores the WAL too, so it is only safe when nothing is writing
+    uri = f"file:{db_path}?mode=ro&immutable=1" if immutable else f"file:{db_path}?mode=ro"
+    if backend == "apsw":
+        # apsw wraps the C API directly, skipping the sqlite3 module's per-call
+        # cursor and row bookkeeping; its connections are always serialized
+        conn = apsw.Connection(
+            uri,
+            flags=apsw.SQLITE_OPEN_READONLY | apsw.SQLITE_OPEN_URI,
+            statementcachesize=128,
+        )
+        conn.set_busy_timeout(5000)
+        # apsw runs later statements of a script as its rows are consumed
+        for _ in conn.execute(READER_PRAGMAS):
+            pass
+        return conn
+
+    conn = sqlite3.connect(
+        uri,
+        uri=True,
+        timeout=5.0,
+        cached_statements=128,
+        check_same_thread=check_same_thread,
+    )
+    conn.executescript(READER_PRAGMAS)
+    return conn
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a bounded queue that drops records when it is full"""
+
+    def __init__(self, log_queue, block: bool = False):
+        super().__init__(log_queue)
+        self.block = block
+
+    def enqueue(self, record):
+        if self.block:
+            self.queue.put(record)
+            return
+        # A stalled listener costs us log lines, not unbounded memory or a
+        # blocked reader
+        with contextlib.suppress(queue.Full):
+            self.queue.put_nowait(record)
+
+
+def queue_logger(name: str, log_queue, block: bool = False) -> logging.Logger:
+    """
+    Get a debug logger whose records are handed to a QueueListener.
+
+    Formatting happens in the caller, but the file write happens on the
+    listener's thread, so readers never block on log I/O.
+
+    Args:
+        name: Logger name
+        log_queue: Bounded queue the debug QueueListener is reading from
+        block: Wait for room instead of dropping records when the queue is full
+    """
+    logger = logging.getLogger(name)
+    logger.addHandler(BoundedQueueHandler(log_queue, block))
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
 
 def reader_process(
     db_path: str,
     reader_id: int,
     duration: int,
     interval: float,
-    results_queue: multiprocessing.Queue,
-    debug: bool = False,
+    stats,
+    results_conn: multiprocessing.connection.Connection,
+    log_queue=None,
+    immutable: bool = False,
+    backend: str = "sqlite3",
+    shared_conn=None,
 ):
     """
-    Individual reader process that queries the database.
+    Individual reader process (or thread) that queries the database.
 
     Args:
         db_path: Path to the SQLite database
         reader_id: Unique identifier for this reader
         duration: How long to run (seconds)
         interval: Time between reads (seconds)
-        results_queue: Queue to report results
+        stats: Shared stats array this reader writes its row into
+        results_conn: Write end of this reader's results pipe for errors
+        log_queue: Queue for debug log records, or None when not debugging
+        immutable: Open the database as immutable, skipping all locking
+        backend: SQLite binding to read with, "sqlite3" or "apsw"
+        shared_conn: Connection shared by all reader threads, used instead of
+            opening one per reader
     """
-    # Ignore keyboard interrupts in child processes
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Ignore keyboard interrupts in child processes; signal handlers can only
+    # be set from the main thread, and reader threads never see SIGINT anyway
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # Spread readers round-robin over the CPUs we're allowed to use so they
+    # don't pile onto the same cores and bounce the -shm cache lines between
+    # them. Linux only; elsewhere psutil.Process().cpu_affinity() could do this.
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        with contextlib.suppress(OSError):
+            os.sched_setaffinity(0, {cpus[reader_id % len(cpus)]})
 
     start_time = time.time()
+    ticks = 0
     read_count = 0
     error_count = 0
     last_count = 0
     last_id = None
+    conn = shared_conn
+    cursor = None
+    row = reader_id * STAT_SLOTS
+    log = queue_logger(f"test_readers.reader{reader_id}", log_queue) if log_queue else None
 
     while time.time() - start_time < duration:
         try:
-            # Use read-only connection
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=5.0)
-            cursor = conn.cursor()
-
-            # Get current count
-            cursor.execute("SELECT COUNT(*) FROM sensor_readings")
-            count = cursor.fetchone()[0]
+            # Keep one read-only connection for the whole run so each read
+            # skips the open syscalls, schema parse and cold page cache
+            if cursor is None:
+                if conn is None:
+                    conn = open_reader_connection(db_path, immutable, backend=backend)
+                cursor = conn.cursor()
+                ((base_count, base_id),) = cursor.execute(BASELINE_QUERY).fetchall()
 
             # Get latest reading
-            cursor.execute("""
-                SELECT id, timestamp, sensor_id, temperature, humidity
-                FROM sensor_readings
-                ORDER BY id DESC
-                LIMIT 1
-            """)
-            latest = cursor.fetchone()
-
-            conn.close()
+            # fetchall() runs the statement to completion so its read snapshot
+            # ends; apsw, unlike sqlite3, doesn't step past the last row itself
+            rows = cursor.execute(LATEST_QUERY).fetchall()
+            latest = rows[0] if rows else None
 
             read_count += 1
             latest_id = latest[0] if latest else None
 
+            # Rows are only ever appended with increasing ids, so the count is
+            # the baseline plus however far the newest id has moved since then
+            count = base_count + (latest_id or base_id) - base_id
+
             # Report progress
-            results_queue.put(
-                {
-                    "reader_id": reader_id,
-                    "count": count,
-                    "latest_id": latest_id,
-                    "latest_temp": latest[3] if latest else None,
-                    "reads": read_count,
-                    "errors": error_count,
-                    "new_records": count - last_count if last_count > 0 else 0,
-                }
-            )
+            stats[row + READS] = read_count
+            stats[row + COUNT] = count
+            stats[row + LATEST_ID] = -1 if latest_id is None else latest_id
+            stats[row + NEW_RECORDS] = count - last_count if last_count > 0 else 0
+            stats[row + UPDATED_MS] = time.time_ns() // 1_000_000
 
             last_count = count
             last_id = latest_id
 
-        except sqlite3.OperationalError as e:
+            if log:
+                log.debug("read #%d count=%d latest_id=%s", read_count, count, latest_id)
+
+        except DB_ERRORS as e:
             error_count += 1
-            error_msg = str(e)
-            # Add context to common errors
-            if "database is locked" in error_msg:
-                error_msg = f"Database locked (read #{read_count})"
-            elif "no such table" in error_msg:
-                error_msg = f"Table missing: {error_msg}"
-            elif "database disk image is malformed" in error_msg:
-                error_msg = "DATABASE CORRUPTED - disk image malformed"
-            elif "file is not a database" in error_msg:
-                error_msg = "DATABASE CORRUPTED - invalid file"
-            results_queue.put(
-                {
-                    "reader_id": reader_id,
-                    "error": error_msg,
-                    "reads": read_count,
-                    "errors": error_count,
-                }
-            )
+            stats[row + ERRORS] = error_count
+            # Reopen on the next iteration in case the file was replaced
+            cursor = None
+            if conn is not None and shared_conn is None:
+                conn.close()
+                conn = None
+            # Errors raised by the sqlite3 module itself have no error code;
+            # otherwise mask extended codes down to the primary one. apsw
+            # exposes the result code as .result instead.
+            code = getattr(e, "sqlite_errorcode", getattr(e, "result", None))
+            if code is not None:
+                code &= 0xFF
+            report = {
+                "reader_id": reader_id,
+                "code": code,
+                "reads": read_count,
+                "errors": error_count,
+            }
+            if code not in ERROR_LABELS:
+                report["error"] = str(e)
+            results_conn.send(report)
+            if log:
+                log.debug("error #%d after %d reads: %s", error_count, read_count, e)
 
         except Exception as e:
             error_count += 1
-            # Send general exceptions to queue too
-            results_queue.put(
+            stats[row + ERRORS] = error_count
+            # A failure while setting up the connection leaves it half-built
+            cursor = None
+            if conn is not None and shared_conn is None:
+                conn.close()
+                conn = None
+            # Send general exceptions to the monitor too
+            results_conn.send(
                 {
                     "reader_id": reader_id,
+                    "code": None,
                     "error": f"Unexpected error: {type(e).__name__}: {str(e)}",
                     "reads": read_count,
                     "errors": error_count,
                 }
             )
 
+        # Sleep until the next absolute deadline rather than a full interval,
+        # so the time spent reading doesn't stretch the period and readers
+        # stay on a steady cadence
+        ticks += 1
         try:
-            time.sleep(interval)
+            time.sleep(max(0.0, start_time + ticks * interval - time.time()))
         except (KeyboardInterrupt, SystemExit):
             # Gracefully handle interrupts during sleep
             break
 
+    if conn is not None and shared_conn is None:
+        conn.close()
+
     # Final report
-    results_queue.put(
+    results_conn.send(
         {
             "reader_id": reader_id,
             "final": True,
             "reads": read_count,
             "errors": error_count,
-            "total_reads": read_count,
-            "total_errors": error_count,
             "count": last_count,
             "latest_id": last_id,
             "duration": time.time() - start_time,
         }
     )
+    results_conn.close()
 
 
 def monitor_readers(
-    results_queue: multiprocessing.Queue,
+    stats,
+    connections: list[multiprocessing.connection.Connection],
     num_readers: int,
     duration: int,
 ):
     """
     Monitor and display results from all reader processes.
 
+    Each reader has its own pipe, so there is no shared queue lock for the
+    readers to contend on and a dead reader shows up as EOF on its pipe.
+    A background thread drains the pipes while this thread only redraws,
+    so a slow terminal never holds up reading reader messages.
+
     Args:
-        results_queue: Queue receiving results from readers
+        stats: Shared stats array holding one row per reader
+        connections: Read ends of the per-reader results pipes
         num_readers: Number of reader processes
         duration: Expected duration (for progress display)
     """
-    reader_stats = {}
+    reader_stats = {}  # Last pipe message (error or final report) per reader
     start_time = time.time()
-    completed_readers = 0
-    error_log = []  # Track all errors for display
+    # Counters written only by the drainer thread; messages tells the display
+    # loop whether anything arrived since its last redraw
+    progress = {"completed": 0, "messages": 0}
+    drained = threading.Event()
+    error_log = []  # Labels of all errors, for the summary
+
+    def drain_results():
+        """Read reader messages as they arrive until every reader is done"""
+        pending = list(connections)
+        while pending and progress["completed"] < num_readers:
+            for conn in multiprocessing.connection.wait(pending):
+                try:
+                    result = conn.recv()
+                except EOFError:
+                    # Reader exited and closed its end of the pipe
+                    pending.remove(conn)
+                    continue
+
+                reader_id = result.get("reader_id")
+                if result.get("final"):
+                    progress["completed"] += 1
+
+                # Capture error messages
+                if "code" in result:
+                    error_log.append(ERROR_LABELS.get(result["code"]) or result["error"])
+
+                reader_stats[reader_id] = result
+                progress["messages"] += 1
+        drained.set()
 
     def create_table():
         """Create a status table for display"""
@@ -178,74 +393,86 @@ def monitor_readers(
         table.add_column("New/sec", style="green", justify="right", width=8)
         table.add_column("Status", style="white", width=15)
 
-        # Add rows for each reader
+        # Add rows for each reader, totalling as we go rather than making
+        # separate passes over the array for the summary row
+        total_reads = total_errors = 0
         for reader_id in range(num_readers):
-            if reader_id in reader_stats:
-                stats = reader_stats[reader_id]
-                if stats.get("final"):
-                    status = "[green]Complete[/green]"
-                elif stats.get("error"):
-                    status = "[red]Error[/red]"
-                else:
-                    status = "[yellow]Reading...[/yellow]"
-
+            row = reader_id * STAT_SLOTS
+            reads, errors, count, latest_id, new_records, updated_ms = stats[row : row + STAT_SLOTS]
+            total_reads += reads
+            total_errors += errors
+            message = reader_stats.get(reader_id, {})
+            if message.get("final"):
+                status = "[green]Complete[/green]"
+            elif "code" in message and message["reads"] == reads:
+                # No successful read since the last error
+                status = "[red]Error[/red]"
+            elif updated_ms:
+                status = "[yellow]Reading...[/yellow]"
+            else:
                 table.add_row(
-                    f"#{reader_id}",
-                    str(stats.get("reads", 0)),
-                    str(stats.get("errors", 0)),
-                    str(stats.get("count", "-")),
-                    str(stats.get("latest_id", "-")),
-                    f"{stats.get('new_records', 0):.1f}",
-                    status,
+                    f"#{reader_id}", "0", str(errors), "-", "-", "0.0", "[dim]Starting...[/dim]"
                 )
-            else:
-                table.add_row(f"#{reader_id}", "0", "0", "-", "-", "0.0", "[dim]Starting...[/dim]")
+                continue
+
+            table.add_row(
+                f"#{reader_id}",
+                str(reads),
+                str(errors),
+                str(count) if updated_ms else "-",
+                str(latest_id) if latest_id >= 0 else "-",
+                f"{new_records:.1f}",
+                status,
+            )
 
         # Add summary row
         table.add_row(
             "[bold]Total[/bold]",
-            f"[bold]{sum(s.get('reads', 0) for s in reader_stats.values())}[/bold]",
-            f"[bold]{sum(s.get('errors', 0) for s in reader_stats.values())}[/bold]",
+            f"[bold]{total_reads}[/bold]",
+            f"[bold]{total_errors}[/bold]",
             "-",
             "-",
             "-",
             "-",
-            f"[bold]{completed_readers}/{num_readers}[/bold]",
+            f"[bold]{progress['completed']}/{num_readers}[/bold]",
         )
 
         # Add timing info
-        elapsed = time.time() - start_time
-        remaining = max(0, duration - elapsed)
-        table.caption = f"Elapsed: {elapsed:.1f}s | Remaining: {remaining:.1f}s"
+        table.caption = timing_caption()
 
         return table
 
-    with Live(create_table(), refresh_per_second=2, console=console) as live:
-        while completed_readers < num_readers and time.time() - start_time < duration + 5:
-            try:
-                # Get result with timeout
-                result = results_queue.get(timeout=0.5)
-
-                reader_id = result.get("reader_id")
-                if result.get("final"):
-                    completed_readers += 1
-
-                # Capture error messages
-                if result.get("error"):
-                    error_log.append(f"Reader #{reader_id}: {result.get('error')}")
-
-                reader_stats[reader_id] = result
-                live.update(create_table())
-
-            except Exception:
-                # Timeout - just update display
-                live.update(create_table())
+    def timing_caption():
+        """Format the elapsed/remaining time shown under the table"""
+        elapsed = time.time() - start_time
+        remaining = max(0, duration - elapsed)
+        return f"Elapsed: {elapsed:.1f}s | Remaining: {remaining:.1f}s"
+
+    threading.Thread(target=drain_results, daemon=True).start()
+
+    table = create_table()
+    last_snapshot = bytes(stats)
+    last_messages = 0
+    with Live(table, refresh_per_second=2, console=console) as live:
+        while not drained.is_set() and time.time() - start_time < duration + 5:
+            drained.wait(0.5)
+
+            # Only rebuild the table when a message arrived or a reader's row
+            # changed; otherwise just tick the caption on the existing one
+            snapshot = bytes(stats)
+            if progress["messages"] != last_messages or snapshot != last_snapshot:
+                last_messages = progress["messages"]
+                table = create_table()
+                live.update(table)
+                last_snapshot = snapshot
+            else:
+                table.caption = timing_caption()
 
     # Print final summary
     console.print("\n[bold]Test Complete![/bold]")
 
-    total_reads = sum(s.get("total_reads", s.get("reads", 0)) for s in reader_stats.values())
-    total_errors = sum(s.get("total_errors", s.get("errors", 0)) for s in reader_stats.values())
+    total_reads = sum(stats[READS::STAT_SLOTS])
+    total_errors = sum(stats[ERRORS::STAT_SLOTS])
 
     summary = Table(title="Summary", show_header=True)
     summary.add_column("Metric", style="cyan")
@@ -266,16 +493,7 @@ def monitor_readers(
         # Group errors by type
         error_counts = {}
         for error in error_log:
-            # Extract error type from message
-            if "DATABASE CORRUPTED" in error:
-                key = "DATABASE CORRUPTED"
-            elif "Database locked" in error:
-                key = "Database locked"
-            elif "Table missing" in error:
-                key = "Table missing"
-            else:
-                key = error.split(": ", 1)[1] if ": " in error else error
-            error_counts[key] = error_counts.get(key, 0) + 1
+            error_counts[error] = error_counts.get(error, 0) + 1
 
         # Display error summary
         for error_type, count in sorted(error_counts.items(), key=lambda x: -x[1])[:5]:
@@ -314,11 +532,35 @@ def monitor_readers(
     help="Read interval in seconds",
     type=click.FloatRange(0.1, 10.0),
 )
+@click.option(
+    "--executor",
+    "-e",
+    default="thread",
+    help="Run readers as threads or as separate processes",
+    type=click.Choice(["thread", "process"]),
+)
+@click.option(
+    "--shared-connection",
+    is_flag=True,
+    help="In thread mode, have all readers share one connection and page cache",
+)
+@click.option(
+    "--backend",
+    default="sqlite3",
+    help="SQLite binding for readers; apsw must be installed (e.g. uv run --with apsw)",
+    type=click.Choice(["sqlite3", "apsw"]),
+)
 @click.option(
     "--check-writes",
     is_flag=True,
     help="Check if database is being written to",
 )
+@click.option(
+    "--immutable/--no-immutable",
+    default=None,
+    help="Open readers with immutable=1 (no locking). Only safe when nothing is "
+    "writing; by default enabled only if --check-writes finds the database idle",
+)
 @click.option(
     "--debug",
     is_flag=True,
@@ -329,14 +571,20 @@ def main(
     readers: int,
     duration: int,
     interval: float,
+    executor: str,
+    shared_connection: bool,
+    backend: str,
     check_writes: bool,
+    immutable: bool | None,
     debug: bool,
 ):
     """
     Test concurrent readers against an existing sensor database.
 
-    This script spawns multiple reader processes that continuously query
-    the database to test read performance and concurrency handling.
+    This script spawns multiple readers that continuously query the database
+    to test read performance and concurrency handling. Readers spend their
+    time in SQLite and sleep, both of which release the GIL, so threads are
+    the default; use --executor process to exercise separate processes.
     It does NOT start the sensor simulator - it expects the database
     to already exist and optionally be actively written to by another process.
 
@@ -351,9 +599,19 @@ def main(
         # Test with faster read interval
         ./test_readers.py -i 0.1
 
+        # Run each reader in its own process
+        ./test_readers.py -e process
+
+        # Have 100 reader threads share a single connection
+        ./test_readers.py -r 100 --shared-connection
+
         # Check if database is being actively written to
         ./test_readers.py --check-writes
     """
+    if shared_connection and executor != "thread":
+        raise click.UsageError("--shared-connection requires --executor thread")
+    if backend == "apsw" and apsw is None:
+        raise click.UsageError("--backend apsw requires the apsw package")
 
     console.print("\n[bold blue]🔍 Concurrent Database Reader Test[/bold blue]")
     console.print(f"[dim]Testing read performance with {readers} concurrent readers[/dim]\n")
@@ -367,71 +625,115 @@ def main(
         )
         return 1
 
-    # Check database accessibility
+    # Check database accessibility, reusing the same connection for the write
+    # check; ids only grow, so comparing MAX(id) avoids a second full COUNT(*)
     try:
         conn = sqlite3.connect(f"file:{database}?mode=ro", uri=True, timeout=1.0)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM sensor_readings")
-        initial_count = cursor.fetchone()[0]
-        conn.close()
-
-        console.print(f"[green]✓[/green] Database accessible: {database}")
-        console.print(f"[green]✓[/green] Initial record count: {initial_count:,}")
-
-        # Check if database is being written to
-        if check_writes:
-            console.print("[yellow]Checking for active writes...[/yellow]")
-            time.sleep(2)
-            conn = sqlite3.connect(f"file:{database}?mode=ro", uri=True, timeout=1.0)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM sensor_readings")
-            new_count = cursor.fetchone()[0]
-            conn.close()
-
-            if new_count > initial_count:
-                rate = (new_count - initial_count) / 2.0
-                console.print(
-                    f"[green]✓[/green] Database is being written to ({rate:.1f} records/sec)"
-                )
-            else:
-                console.print("[yellow]![/yellow] No new writes detected - database may be idle")
+        with contextlib.closing(conn):
+            initial_count, initial_id = conn.execute(BASELINE_QUERY).fetchone()
+
+            console.print(f"[green]✓[/green] Database accessible: {database}")
+            console.print(f"[green]✓[/green] Initial record count: {initial_count:,}")
+
+            # Check if database is being written to
+            if check_writes:
+                console.print("[yellow]Checking for active writes...[/yellow]")
+                time.sleep(2)
+                (new_id,) = conn.execute(MAX_ID_QUERY).fetchone()
+
+                if new_id > initial_id:
+                    rate = (new_id - initial_id) / 2.0
+                    console.print(
+                        f"[green]✓[/green] Database is being written to ({rate:.1f} records/sec)"
+                    )
+                else:
+                    console.print(
+                        "[yellow]![/yellow] No new writes detected - database may be idle"
+                    )
+                    if immutable is None:
+                        immutable = True
 
     except sqlite3.Error as e:
         console.print(f"[red]✗ Database error: {e}[/red]")
         return 1
 
     console.print("\n[blue]Starting test:[/blue]")
-    console.print(f"  • Readers: {readers}")
+    console.print(f"  • Readers: {readers} ({executor} mode)")
+    if shared_connection:
+        console.print("  • Connection: one shared by all readers")
+    if backend != "sqlite3":
+        console.print(f"  • Backend: {backend}")
     console.print(f"  • Duration: {duration} seconds")
     console.print(f"  • Read interval: {interval} seconds")
+    if immutable:
+        console.print("  • Immutable mode: [yellow]ENABLED[/yellow] (new writes will not be seen)")
     if debug:
         console.print("  • Debug logging: [yellow]ENABLED[/yellow] (see test_readers_debug.log)")
     console.print("")
 
-    # Create results queue
-    results_queue = multiprocessing.Queue()
+    # fork starts a reader without re-importing this module or pickling its
+    # arguments, which spawn (the default off Linux) pays for every reader
+    ctx = multiprocessing.get_context("fork" if sys.platform == "linux" else "spawn")
 
-    # Set up debug logging if requested
-    debug_file = None
+    # Set up debug logging if requested. Readers only enqueue records; a single
+    # listener thread owns the file, so readers never contend on its writes.
+    log_queue = None
+    listener = None
     if debug:
-        debug_file = open("test_readers_debug.log", "w")
-        debug_file.write(f"Test started at {datetime.datetime.now()}\n")
-        debug_file.write(f"Database: {database}\n")
-        debug_file.write(f"Readers: {readers}, Duration: {duration}s, Interval: {interval}s\n\n")
-        debug_file.flush()
-
-    # Start reader processes
+        log_queue = ctx.Queue(maxsize=readers * DEBUG_QUEUE_PER_READER)
+        handler = logging.FileHandler("test_readers_debug.log", mode="w")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s: %(message)s"))
+        listener = logging.handlers.QueueListener(log_queue, handler)
+        listener.start()
+        debug_log = queue_logger("test_readers", log_queue, block=True)
+        debug_log.debug("Test started")
+        debug_log.debug("Database: %s", database)
+        debug_log.debug("Readers: %d, Duration: %ds, Interval: %ss", readers, duration, interval)
+
+    # Start readers, each with its own row in the shared stats array and its
+    # own one-way pipe for errors and the final report. The same RawArray and
+    # pipes work unchanged for threads, so the monitor doesn't care which
+    # executor is used.
+    stats = ctx.RawArray("q", readers * STAT_SLOTS)
     processes = []
+    connections = []
+
+    # A single serialized connection means one page cache instead of one per
+    # reader; each query only holds SQLite's connection mutex for microseconds
+    shared_conn = None
+    if shared_connection:
+        shared_conn = open_reader_connection(
+            database, bool(immutable), check_same_thread=False, backend=backend
+        )
+        shared_conn.execute("PRAGMA cache_size=-131072;")  # 128MB
+
     for i in range(readers):
-        p = multiprocessing.Process(
-            target=reader_process, args=(database, i, duration, interval, results_queue, debug)
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        args = (
+            database,
+            i,
+            duration,
+            interval,
+            stats,
+            send_conn,
+            log_queue,
+            bool(immutable),
+            backend,
         )
-        p.start()
-        processes.append(p)
+        if executor == "thread":
+            # Daemon threads can't be terminated, but won't keep us alive on Ctrl+C
+            threading.Thread(target=reader_process, args=(*args, shared_conn), daemon=True).start()
+        else:
+            p = ctx.Process(target=reader_process, args=args)
+            p.start()
+            # Drop our copy of the write end so the pipe hits EOF when the reader exits
+            send_conn.close()
+            processes.append(p)
+        connections.append(recv_conn)
 
     # Monitor results
     try:
-        monitor_readers(results_queue, readers, duration)
+        monitor_readers(stats, connections, readers, duration)
     except KeyboardInterrupt:
         console.print("\n[yellow]Test interrupted by user[/yellow]")
     finally:
@@ -449,19 +751,19 @@ def main(
                 p.kill()
                 p.join(timeout=0.5)
 
-    # Clean up the queue
-    try:
-        while not results_queue.empty():
-            results_queue.get_nowait()
-    except Exception:
-        pass
+    # Clean up the pipes
+    for conn in connections:
+        conn.close()
+    if shared_conn is not None:
+        shared_conn.close()
 
     console.print("\n[bold green]✓ Test complete![/bold green]")
 
-    # Close debug file if open
-    if debug_file:
-        debug_file.write(f"\nTest completed at {datetime.datetime.now()}\n")
-        debug_file.close()
+    # Flush and close the debug log if enabled
+    if listener:
+        debug_log.debug("Test completed")
+        listener.stop()
+        handler.close()
         console.print("[dim]Debug log saved to test_readers_debug.log[/dim]")
 
     return 0
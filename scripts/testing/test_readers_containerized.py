@@ -7,6 +7,8 @@ the same SQLite database to test cross-container database access patterns.
 """
 
 import json
+import os
+import selectors
 import sqlite3
 import subprocess
 import sys
@@ -21,8 +23,16 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# orjson parses the readers' stats lines in C when it is installed
+json_loads = json.loads if orjson is None else orjson.loads
+
 
 class ContainerizedReaderTest:
     """Manage containerized database reader tests."""
@@ -34,14 +44,19 @@ class ContainerizedReaderTest:
         test_duration: int,
         read_interval: float,
         image_name: str = "sensor-reader-test",
+        immutable: bool = False,
     ):
         self.db_path = Path(db_path).resolve()
         self.num_containers = num_containers
         self.test_duration = test_duration
         self.read_interval = read_interval
         self.image_name = image_name
+        self.immutable = immutable
         self.containers: list[str] = []
         self.reader_stats: dict[int, dict] = {}
+        # Formatted table cells per container, keyed by the stats dict they
+        # were built from; collect_stats stores a new dict on every update
+        self._row_cache: dict[int, tuple[dict, tuple[str, ...]]] = {}
 
         # Verify database exists
         if not self.db_path.exists():
@@ -66,7 +81,31 @@ import time
 import os
 from datetime import datetime
 
-def read_database(db_path, container_id, duration, interval):
+# Module-level SQL so every read passes the identical string and hits the
+# connection's statement cache. There is no COUNT(*): ids are AUTOINCREMENT
+# and rows are never deleted, so the latest id is also the record count.
+LATEST_QUERY = """
+    SELECT id, timestamp, sensor_id, temperature
+    FROM sensor_readings
+    ORDER BY id DESC
+    LIMIT 1
+"""
+
+def open_connection(db_path, immutable=False):
+    """Open the read-only connection reused for every read."""
+    # locking_mode=EXCLUSIVE is no use here: on a WAL database a mode=ro
+    # connection cannot take the exclusive lock (disk I/O error), and a
+    # writable one would lock the generator out. immutable=1 skips locking
+    # entirely instead, but SQLite then ignores the WAL, so it is only safe
+    # when nothing is writing.
+    uri = f"file:{db_path}?mode=ro&immutable=1" if immutable else f"file:{db_path}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA mmap_size = 134217728")
+    return conn
+
+def read_database(db_path, container_id, duration, interval, immutable=False):
     """Read from database and report statistics."""
     start_time = time.time()
     stats = {
@@ -75,33 +114,26 @@ def read_database(db_path, container_id, duration, interval):
         "errors": 0,
         "total_records": 0,
         "latest_record": None,
-        "read_times": []
     }
+    # Running total instead of a list of samples, so each JSON line stays the
+    # same size however long the test runs
+    total_read_time = 0.0
+    conn = None
+    cursor = None
 
     while time.time() - start_time < duration:
         try:
             read_start = time.time()
 
-            # Connect with read-only mode
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-            conn.execute("PRAGMA query_only = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-
-            cursor = conn.cursor()
+            # Reuse the connection and cursor; both are only reopened after an error
+            if conn is None:
+                conn = open_connection(db_path, immutable)
+                cursor = conn.cursor()
 
-            # Get total count
-            cursor.execute("SELECT COUNT(*) FROM sensor_readings")
-            count = cursor.fetchone()[0]
-            stats["total_records"] = count
-
-            # Get latest record
-            cursor.execute("""
-                SELECT id, timestamp, sensor_id, temperature
-                FROM sensor_readings
-                ORDER BY id DESC
-                LIMIT 1
-            """)
+            # Get latest record; its id also gives the total count
+            cursor.execute(LATEST_QUERY)
             latest = cursor.fetchone()
+            stats["total_records"] = latest[0] if latest else 0
             if latest:
                 stats["latest_record"] = {
                     "id": latest[0],
@@ -110,11 +142,9 @@ def read_database(db_path, container_id, duration, interval):
                     "temperature": latest[3]
                 }
 
-            conn.close()
-
-            read_time = time.time() - read_start
-            stats["read_times"].append(read_time)
+            total_read_time += time.time() - read_start
             stats["reads"] += 1
+            stats["avg_read_time"] = total_read_time / stats["reads"]
 
             # Output current stats as JSON
             print(json.dumps(stats), flush=True)
@@ -123,13 +153,17 @@ def read_database(db_path, container_id, duration, interval):
             stats["errors"] += 1
             stats["last_error"] = str(e)
             print(json.dumps(stats), flush=True)
+            if conn is not None:
+                conn.close()
+                conn = cursor = None
 
         time.sleep(interval)
 
+    if conn is not None:
+        conn.close()
+
     # Final stats
     stats["final"] = True
-    if stats["read_times"]:
-        stats["avg_read_time"] = sum(stats["read_times"]) / len(stats["read_times"])
     print(json.dumps(stats), flush=True)
 
 if __name__ == "__main__":
@@ -139,9 +173,12 @@ if __name__ == "__main__":
     parser.add_argument("--container-id", required=True)
     parser.add_argument("--duration", type=int, default=30)
     parser.add_argument("--interval", type=float, default=0.5)
+    parser.add_argument("--immutable", action="store_true")
     args = parser.parse_args()
 
-    read_database(args.db_path, args.container_id, args.duration, args.interval)
+    read_database(
+        args.db_path, args.container_id, args.duration, args.interval, args.immutable
+    )
 '''
 
             # Create Dockerfile
@@ -208,26 +245,54 @@ ENTRYPOINT ["python", "/app/reader.py"]
             "--interval",
             str(self.read_interval),
         ]
+        if self.immutable:
+            cmd.append("--immutable")
 
         # Start container in background
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
         )
 
         return container_name, process
 
-    def collect_stats(self, process, container_id: int):
-        """Collect statistics from a container's output."""
-        for line in process.stdout:
-            try:
-                stats = json.loads(line.strip())
-                self.reader_stats[container_id] = stats
-            except json.JSONDecodeError:
-                pass
+    def collect_stats(self, selector: selectors.BaseSelector, pending: dict, timeout: float):
+        """Collect statistics from the containers' output for up to timeout seconds.
+
+        All container pipes are drained from this one thread. Each line is a
+        complete stats snapshot, so of everything that arrived since the last
+        read only the newest complete line is parsed.
+
+        Args:
+            selector: Selector with each container's stdout registered, with
+                the container id as its data
+            pending: Partial trailing line per container id, carried between reads
+            timeout: Seconds to wait for output before returning
+        """
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            if not selector.get_map():
+                # Every container has exited
+                time.sleep(remaining)
+                return
+
+            for key, _ in selector.select(remaining):
+                container_id = key.data
+                # The pipe is readable, so this returns without blocking
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+
+                data = pending.get(container_id, b"") + chunk
+                *lines, pending[container_id] = data.split(b"\n")
+                for line in reversed(lines):
+                    try:
+                        self.reader_stats[container_id] = json_loads(line)
+                        break
+                    except ValueError:
+                        continue
 
     def run_test(self):
         """Run the containerized reader test."""
@@ -281,17 +346,12 @@ ENTRYPOINT ["python", "/app/reader.py"]
 
         console.print(f"\n[green]All {self.num_containers} containers started![/green]\n")
 
-        # Monitor containers
-        import threading
-
-        # Start threads to collect stats from each container
-        threads = []
-        for container_id, container_name, process in processes:
-            thread = threading.Thread(
-                target=self.collect_stats, args=(process, container_id), daemon=True
-            )
-            thread.start()
-            threads.append(thread)
+        # Watch every container's output from this thread; a thread per
+        # container stops scaling once there are dozens of them
+        selector = selectors.DefaultSelector()
+        for container_id, _, process in processes:
+            selector.register(process.stdout, selectors.EVENT_READ, container_id)
+        pending: dict[int, bytes] = {}
 
         # Display live stats
         start_time = time.time()
@@ -305,7 +365,9 @@ ENTRYPOINT ["python", "/app/reader.py"]
                     border_style="blue",
                 )
                 live.update(panel)
-                time.sleep(0.5)
+                self.collect_stats(selector, pending, 0.5)
+
+        selector.close()
 
         # Stop containers
         console.print("\n[yellow]Stopping containers...[/yellow]")
@@ -332,41 +394,46 @@ ENTRYPOINT ["python", "/app/reader.py"]
         table.add_column("Status", style="white", width=15)
 
         for i in range(self.num_containers):
-            if i in self.reader_stats:
-                stats = self.reader_stats[i]
-
-                if stats.get("final"):
-                    status = "[green]Complete[/green]"
-                elif stats.get("errors", 0) > 0:
-                    status = "[yellow]Reading (errors)[/yellow]"
-                else:
-                    status = "[green]Reading...[/green]"
-
-                avg_read = "-"
-                if "avg_read_time" in stats:
-                    avg_read = f"{stats['avg_read_time'] * 1000:.1f}"
-                elif stats.get("read_times"):
-                    avg_time = sum(stats["read_times"]) / len(stats["read_times"])
-                    avg_read = f"{avg_time * 1000:.1f}"
-
-                latest_id = "-"
-                if stats.get("latest_record"):
-                    latest_id = str(stats["latest_record"]["id"])
-
-                table.add_row(
-                    f"reader-{i}",
-                    str(stats.get("reads", 0)),
-                    str(stats.get("errors", 0)),
-                    str(stats.get("total_records", "-")),
-                    latest_id,
-                    avg_read,
-                    status,
-                )
-            else:
+            stats = self.reader_stats.get(i)
+            if stats is None:
                 table.add_row(f"reader-{i}", "0", "0", "-", "-", "-", "[dim]Starting...[/dim]")
+                continue
+
+            cached = self._row_cache.get(i)
+            if cached is None or cached[0] is not stats:
+                cached = (stats, self._format_row(i, stats))
+                self._row_cache[i] = cached
+            table.add_row(*cached[1])
 
         return table
 
+    def _format_row(self, container_id: int, stats: dict) -> tuple[str, ...]:
+        """Format one container's stats as table cells."""
+        if stats.get("final"):
+            status = "[green]Complete[/green]"
+        elif stats.get("errors", 0) > 0:
+            status = "[yellow]Reading (errors)[/yellow]"
+        else:
+            status = "[green]Reading...[/green]"
+
+        avg_read = "-"
+        if "avg_read_time" in stats:
+            avg_read = f"{stats['avg_read_time'] * 1000:.1f}"
+
+        latest_id = "-"
+        if stats.get("latest_record"):
+            latest_id = str(stats["latest_record"]["id"])
+
+        return (
+            f"reader-{container_id}",
+            str(stats.get("reads", 0)),
+            str(stats.get("errors", 0)),
+            str(stats.get("total_records", "-")),
+            latest_id,
+            avg_read,
+            status,
+        )
+
     def print_summary(self):
         """Print test summary."""
         console.print("\n[bold green]Test Summary[/bold green]")
@@ -412,7 +479,12 @@ ENTRYPOINT ["python", "/app/reader.py"]
     default="data/sensor_data.db",
     help="Path to the SQLite database",
 )
-def main(num_containers: int, duration: int, interval: float, db_path: str):
+@click.option(
+    "--immutable",
+    is_flag=True,
+    help="Open readers with immutable=1 (no locking). Only safe when nothing is writing",
+)
+def main(num_containers: int, duration: int, interval: float, db_path: str, immutable: bool):
     """
     Test concurrent database readers using Docker containers.
 
@@ -429,6 +501,9 @@ def main(num_containers: int, duration: int, interval: float, db_path: str):
 
         # Test with faster read interval
         ./test_readers_containerized.py -i 0.1
+
+        # Read a static snapshot without any file locking
+        ./test_readers_containerized.py --immutable
     """
 
     tester = ContainerizedReaderTest(
@@ -436,6 +511,7 @@ def main(num_containers: int, duration: int, interval: float, db_path: str):
         num_containers=num_containers,
         test_duration=duration,
         read_interval=interval,
+        immutable=immutable,
     )
 
     try:
@@ -4,6 +4,7 @@ No threading, no complexity, just works.
 """
 
 import contextlib
+import operator
 import sqlite3
 import time
 from datetime import UTC, datetime
@@ -46,18 +47,71 @@ class SensorReadingSchema(BaseModel):
     sensor_type: str | None = None
 
 
+# Pulls a reading's values in INSERT column order with one C-level call
+# instead of an attribute lookup per column
+_insert_values = operator.attrgetter(
+    "timestamp",
+    "sensor_id",
+    "temperature",
+    "humidity",
+    "pressure",
+    "voltage",
+    "vibration",
+    "status_code",
+    "anomaly_flag",
+    "anomaly_type",
+    "firmware_version",
+    "model",
+    "manufacturer",
+    "serial_number",
+    "location",
+    "latitude",
+    "longitude",
+    "original_timezone",
+    "deployment_type",
+    "installation_date",
+    "height_meters",
+)
+
+# One constant string so every batch hits the connection's statement cache
+_INSERT_SQL = """
+    INSERT INTO sensor_readings (
+        timestamp, sensor_id, temperature, humidity, pressure,
+        voltage, vibration, status_code, anomaly_flag, anomaly_type,
+        firmware_version, model, manufacturer, serial_number,
+        location, latitude, longitude, original_timezone,
+        deployment_type, installation_date, height_meters
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Row count without a full table scan: ids are AUTOINCREMENT and rows are never
+# deleted, so the last id handed out (sqlite_sequence, or MAX(id) via the
+# rowid B-tree if that row is missing) equals the number of readings
+_ROW_COUNT_SQL = """
+    SELECT COALESCE(
+        (SELECT seq FROM sqlite_sequence WHERE name = 'sensor_readings'),
+        (SELECT MAX(id) FROM sensor_readings),
+        0
+    )
+"""
+
+
 class SensorDatabase:
     """Simple SQLite database for sensor readings."""
 
-    def __init__(self, db_path: str, preserve_existing_db: bool = False):
+    def __init__(self, db_path: str, preserve_existing_db: bool = False, bulk_mode: bool = False):
         """
         Initialize the sensor database.
 
         Args:
             db_path: Path to the SQLite database file
             preserve_existing_db: If True, keep existing database
+            bulk_mode: If True, build secondary indices on close instead of
+                maintaining them on every insert. Only for write-only bulk
+                loads; readers get full table scans until close.
         """
         self.db_path = db_path
+        self.bulk_mode = bulk_mode
         self.logger = get_safe_logger("SensorDatabase")
         self.conn: sqlite3.Connection | None = None
 
@@ -96,8 +150,9 @@ class SensorDatabase:
             db_dir = Path(self.db_path).parent
             db_dir.mkdir(parents=True, exist_ok=True)
 
-        # Connect to database
-        self.conn = sqlite3.connect(self.db_path, timeout=5.0)
+        # Connect to database. Transactions are managed explicitly so batches
+        # can take the write lock up front with BEGIN IMMEDIATE.
+        self.conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
         self.conn.row_factory = sqlite3.Row
 
         # Set pragmas for performance
@@ -107,6 +162,9 @@ class SensorDatabase:
         cursor.execute("PRAGMA cache_size=-64000")
         cursor.execute("PRAGMA temp_store=MEMORY")
         cursor.execute("PRAGMA mmap_size=134217728")
+        # Explicit PASSIVE checkpoints run every 10 commits, so let the WAL grow
+        # further before SQLite checkpoints on its own in the middle of a commit
+        cursor.execute("PRAGMA wal_autocheckpoint=10000")
 
         # Create table
         cursor.execute("""
@@ -140,13 +198,43 @@ class SensorDatabase:
             )
         """)
 
-        # Create indices
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON sensor_readings(timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sensor_id ON sensor_readings(sensor_id)")
+        if not self.bulk_mode:
+            self._create_indices(cursor)
+
+        # Let SQLite refresh planner statistics for an existing database
+        cursor.execute("PRAGMA optimize")
 
         self.conn.commit()
         cursor.close()
 
+    def _create_indices(self, cursor: sqlite3.Cursor, covering: bool = False):
+        """
+        Create the secondary indices used by readers.
+
+        Args:
+            cursor: Cursor on the open connection
+            covering: Build the wide summary index instead of idx_sensor_id. Every
+                insert has to maintain it, so it is only built once writing is done;
+                otherwise it is dropped so live inserts never pay for it.
+        """
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON sensor_readings(timestamp)")
+        # Partial index holding only anomaly rows, for recent-anomaly lookups and counts
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_anomaly ON sensor_readings(id) WHERE anomaly_flag = 1"
+        )
+        if covering:
+            # Covering index so whole-table summary aggregates scan the index, not the
+            # rows; it leads with sensor_id, so it also serves sensor_id lookups
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_stats_cov ON sensor_readings("
+                "sensor_id, temperature, humidity, pressure, anomaly_flag, timestamp)"
+            )
+            cursor.execute("DROP INDEX IF EXISTS idx_sensor_id")
+        else:
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sensor_id ON sensor_readings(sensor_id)")
+            # A database preserved from an earlier run has the wide index built on close
+            cursor.execute("DROP INDEX IF EXISTS idx_stats_cov")
+
     def store_reading(self, reading: SensorReadingSchema):
         """
         Store a sensor reading using the Pydantic schema.
@@ -154,31 +242,9 @@ class SensorDatabase:
         Args:
             reading: SensorReadingSchema object with validated data
         """
-        # Convert Pydantic model to tuple for SQL insertion
-        reading_tuple = (
-            reading.timestamp,
-            reading.sensor_id,
-            reading.temperature,
-            reading.humidity,
-            reading.pressure,
-            reading.voltage,
-            reading.vibration,
-            reading.status_code,
-            reading.anomaly_flag,
-            reading.anomaly_type,
-            reading.firmware_version,
-            reading.model,
-            reading.manufacturer,
-            reading.serial_number,
-            reading.location,
-            reading.latitude,
-            reading.longitude,
-            reading.original_timezone,  # Fixed: was timezone
-            reading.deployment_type,
-            reading.installation_date,
-            reading.height_meters,
-        )
-        self.batch_buffer.append(reading_tuple)
+        # Convert Pydantic model to tuple for SQL insertion; anomaly_flag stays a
+        # bool, which sqlite3 binds as the integer 0/1 like any other int
+        self.batch_buffer.append(_insert_values(reading))
 
         # Check if we should commit
         current_time = time.time()
@@ -196,19 +262,16 @@ class SensorDatabase:
             # Store count before clearing buffer
             count = len(self.batch_buffer)
 
-            # Use executemany for efficient bulk insert
-            self.conn.executemany(
-                """
-                INSERT INTO sensor_readings (
-                    timestamp, sensor_id, temperature, humidity, pressure,
-                    voltage, vibration, status_code, anomaly_flag, anomaly_type,
-                    firmware_version, model, manufacturer, serial_number,
-                    location, latitude, longitude, original_timezone,
-                    deployment_type, installation_date, height_meters
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                self.batch_buffer,
-            )
+            # Take the write lock before inserting; a deferred transaction would
+            # start as a read and can hit SQLITE_BUSY upgrading while readers
+            # hold the database
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Use executemany for efficient bulk insert
+                self.conn.executemany(_INSERT_SQL, self.batch_buffer)
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
             self.conn.commit()
 
             # Checkpoint WAL periodically for Docker volume sync
@@ -224,9 +287,18 @@ class SensorDatabase:
                 except Exception as e:
                     self.logger.warning(f"Periodic WAL checkpoint failed: {e}")
 
-            # Clear the buffer
-            self.batch_buffer = []
-            self.last_commit_time = time.time()
+            # The simulator can run for days; refresh planner statistics now
+            # and then so reader query plans keep up with the growing table
+            if self._commit_count % 1000 == 0:
+                try:
+                    self.conn.execute("PRAGMA optimize")
+                except Exception as e:
+                    self.logger.warning(f"Periodic PRAGMA optimize failed: {e}")
+
+            # Clear the buffer in place and restart the batch timer; without the
+            # reset every reading after the first timeout would commit on its own
+            self.batch_buffer.clear()
+            self.last_batch_time = time.time()
 
         except sqlite3.Error:
             self.logger.exception("Failed to commit batch")
@@ -262,6 +334,27 @@ class SensorDatabase:
                 if "readonly database" not in str(e):
                     raise
 
+        # Writing is done, so build the covering summary index now rather than
+        # maintaining it row by row. Bulk mode also builds the indices it deferred
+        # in the same pass, then collects planner statistics for them.
+        if self.conn:
+            try:
+                cursor = self.conn.cursor()
+                self._create_indices(cursor, covering=True)
+                if self.bulk_mode:
+                    cursor.execute("ANALYZE")
+                cursor.close()
+                self.logger.info("Secondary indices built on close")
+            except sqlite3.Error as e:
+                self.logger.warning(f"Building indices on close failed: {e}")
+
+        # SQLite recommends running optimize before closing a connection
+        try:
+            if hasattr(self, "conn") and self.conn:
+                self.conn.execute("PRAGMA optimize")
+        except Exception as e:
+            self.logger.warning(f"PRAGMA optimize on close failed: {e}")
+
         # Checkpoint WAL to ensure data is written to main database file
         # This is critical for Docker volumes on macOS/Windows
         try:
@@ -347,9 +440,7 @@ class SensorDatabase:
         try:
             if not self.conn:
                 return False
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
+            self.conn.execute("SELECT 1").fetchone()
         except Exception:
             return False
         else:
@@ -382,12 +473,10 @@ class SensorDatabase:
     def get_database_stats(self) -> dict:
         """Get database statistics."""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM sensor_readings")
-            total = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM sensor_readings WHERE anomaly_flag = 1")
-            anomalies = cursor.fetchone()[0]
+            total = self.conn.execute(_ROW_COUNT_SQL).fetchone()[0]
+            anomalies = self.conn.execute(
+                "SELECT COUNT(*) FROM sensor_readings WHERE anomaly_flag = 1"
+            ).fetchone()[0]
 
             # Calculate database size
             db_size_mb = 0.0
@@ -98,7 +98,15 @@ class SensorSimulator:
         else:
             logger.debug("Starting fresh - old database will be deleted if it exists")
 
-        self.database = SensorDatabase(db_path, preserve_existing_db=preserve_db)
+        # bulk_mode defers secondary indices until close; only for write-only
+        # loads, since readers querying the live database need them
+        bulk_mode = bool(self.config_manager.get_database_config().get("bulk_mode", False))
+        if bulk_mode:
+            logger.info("Database bulk mode - secondary indices are built on close")
+
+        self.database = SensorDatabase(
+            db_path, preserve_existing_db=preserve_db, bulk_mode=bulk_mode
+        )
 
         # Set up logging to file (using config from ConfigManager)
         log_file = self.config_manager.get_logging_config().get("file")
@@ -617,7 +625,9 @@ class SensorSimulator:
 
                         # Always preserve=False when recovering from corruption
                         self.database = SensorDatabase(
-                            self.database.db_path, preserve_existing_db=False
+                            self.database.db_path,
+                            preserve_existing_db=False,
+                            bulk_mode=self.database.bulk_mode,
                         )
                         logger.info("Database recreated successfully, continuing operation")
 
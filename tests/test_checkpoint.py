@@ -62,6 +62,20 @@ class TestDatabaseCheckpointing:
         assert len(readings) == 2  # Should have both TEST001 and TEST002
         db2.close()
 
+    def test_batch_timeout_resets_after_commit(self):
+        """Test that a timeout commit restarts the batch timer."""
+        db = SensorDatabase(self.db_path)
+        db.last_batch_time = time.time() - (db.batch_timeout + 1)
+
+        # The stale batch timer forces this reading to commit immediately
+        db.insert_reading(sensor_id="TEST001", temperature=25.0)
+        assert len(db.batch_buffer) == 0
+
+        # The next reading starts a fresh batch instead of committing alone
+        db.insert_reading(sensor_id="TEST002", temperature=26.0)
+        assert len(db.batch_buffer) == 1
+        db.close()
+
     def test_batch_size_triggers_checkpoint(self):
         """Test that reaching batch size triggers a checkpoint."""
         db = SensorDatabase(self.db_path)
@@ -1,8 +1,9 @@
+import sqlite3
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 
-from src.database import SensorDatabase, SensorReadingSchema
+from src.database import _ROW_COUNT_SQL, SensorDatabase, SensorReadingSchema
 
 
 class TestSensorDatabase:
@@ -100,6 +101,15 @@ class TestSensorDatabase:
 
         db.close()
 
+    def test_reading_count_skips_table_scan(self):
+        """Test that the total reading count is read without scanning the table."""
+        db = SensorDatabase(self.db_path)
+
+        plan = db.conn.execute(f"EXPLAIN QUERY PLAN {_ROW_COUNT_SQL}").fetchall()
+        assert not any(row["detail"] == "SCAN sensor_readings" for row in plan)
+
+        db.close()
+
     def test_is_healthy(self):
         """Test database health check."""
         db = SensorDatabase(self.db_path)
@@ -109,6 +119,72 @@ class TestSensorDatabase:
         db.close()
         assert db.is_healthy() is False
 
+    def test_anomaly_queries_use_partial_index(self):
+        """Test that anomaly lookups are served by the partial anomaly index."""
+        db = SensorDatabase(self.db_path)
+
+        plan = db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM sensor_readings "
+            "WHERE anomaly_flag = 1 ORDER BY id DESC LIMIT 5"
+        ).fetchall()
+        assert any("idx_anomaly" in row["detail"] for row in plan)
+
+        db.close()
+
+    def test_summary_aggregate_uses_covering_index(self):
+        """Test that after a bulk load the summary aggregate is answered from the covering index."""
+        db = SensorDatabase(self.db_path, bulk_mode=True)
+        db.insert_reading(sensor_id="BULK001", temperature=20.0)
+        db.close()
+
+        conn = sqlite3.connect(self.db_path)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*), COUNT(DISTINCT sensor_id), MIN(timestamp), "
+            "MAX(timestamp), AVG(temperature), AVG(humidity), AVG(pressure), SUM(anomaly_flag) "
+            "FROM sensor_readings"
+        ).fetchall()
+        conn.close()
+        assert any("COVERING INDEX idx_stats_cov" in row[3] for row in plan)
+
+    def test_covering_index_built_only_after_writing(self):
+        """Test that live inserts never maintain the wide summary index."""
+        index_query = "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+
+        db = SensorDatabase(self.db_path)
+        indices = {row["name"] for row in db.conn.execute(index_query)}
+        assert "idx_sensor_id" in indices
+        assert "idx_stats_cov" not in indices
+        db.close()
+
+        conn = sqlite3.connect(self.db_path)
+        indices = {row[0] for row in conn.execute(index_query)}
+        conn.close()
+        assert "idx_stats_cov" in indices
+        assert "idx_sensor_id" not in indices
+
+        # Resuming a live run drops it again
+        db = SensorDatabase(self.db_path, preserve_existing_db=True)
+        indices = {row["name"] for row in db.conn.execute(index_query)}
+        assert "idx_sensor_id" in indices
+        assert "idx_stats_cov" not in indices
+        db.close()
+
+    def test_bulk_mode_builds_indices_on_close(self):
+        """Test that bulk mode defers secondary indices until the database is closed."""
+        index_query = "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+
+        db = SensorDatabase(self.db_path, bulk_mode=True)
+        db.insert_reading(sensor_id="BULK001", temperature=20.0)
+        assert db.conn.execute(index_query).fetchall() == []
+        db.close()
+
+        conn = sqlite3.connect(self.db_path)
+        indices = {row[0] for row in conn.execute(index_query)}
+        conn.close()
+        assert {"idx_timestamp", "idx_anomaly", "idx_stats_cov"} <= indices
+        # The covering index leads with sensor_id, so the narrow index would be redundant
+        assert "idx_sensor_id" not in indices
+
     def test_batch_operations(self):
         """Test batch insert operations."""
         db = SensorDatabase(self.db_path)
@@ -178,6 +178,44 @@ class TestSensorSimulator(unittest.TestCase):
 
         assert count > 0, "No readings generated with anomalies enabled"
 
+    def test_simulator_builds_summary_index_when_run_ends(self):
+        """Test that a finished run leaves the covering summary index for readers."""
+        config = get_minimal_config(self.db_path)
+        identity = get_minimal_identity()
+
+        config_manager = ConfigManager(config=config, identity=identity)
+        simulator = SensorSimulator(config_manager=config_manager)
+        simulator.run()
+
+        conn = sqlite3.connect(self.db_path)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*), COUNT(DISTINCT sensor_id), MIN(timestamp), "
+            "MAX(timestamp), AVG(temperature), AVG(humidity), AVG(pressure), SUM(anomaly_flag) "
+            "FROM sensor_readings"
+        ).fetchall()
+        conn.close()
+
+        assert any("COVERING INDEX idx_stats_cov" in row[3] for row in plan)
+
+    def test_simulator_bulk_mode_from_config(self):
+        """Test that database.bulk_mode defers indices until the run ends."""
+        index_query = "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+        config = get_minimal_config(self.db_path)
+        config["database"]["bulk_mode"] = True
+        identity = get_minimal_identity()
+
+        config_manager = ConfigManager(config=config, identity=identity)
+        simulator = SensorSimulator(config_manager=config_manager)
+        assert simulator.database.bulk_mode is True
+        assert simulator.database.conn.execute(index_query).fetchall() == []
+
+        simulator.run()
+
+        conn = sqlite3.connect(self.db_path)
+        indices = {row[0] for row in conn.execute(index_query)}
+        conn.close()
+        assert {"idx_timestamp", "idx_anomaly", "idx_stats_cov"} <= indices
+
     def test_simulator_with_different_firmware_versions(self):
         """Test simulator with different firmware versions."""
         config = get_minimal_config(self.db_path)